@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import make_dataclass
 from functools import lru_cache
 
 from pydantic import Field
@@ -7,18 +8,25 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    model_config = SettingsConfigDict(extra="ignore", env_file=".env")
+    model_config = SettingsConfigDict(extra="ignore", env_file=".env", frozen=True)
 
     app_name: str = "BURCH-EIDOLON API"
     cors_origin: str = "http://localhost:3000"
 
     database_url: str = "sqlite+pysqlite:///./eidolon.db"
+    # Connection pool sizing for server databases (ignored for SQLite).
+    db_pool_size: int = Field(default=20, ge=1, le=200)
+    db_max_overflow: int = Field(default=20, ge=0, le=200)
+    db_pool_recycle: int = Field(default=1800, ge=-1)
     redis_url: str = "redis://localhost:6379/0"
 
     searxng_base_url: str = "http://localhost:8080"
     # Restrict to engines that reliably return results without CAPTCHAs in a self-hosted setup.
     # Comma-separated list passed through to SearXNG's `engines` query param.
     searxng_engines: str = "duckduckgo,brave,seznam,bing"
+    # Upper bound on search queries in flight at once across a refresh (SourceRouter.search_many and the
+    # per-brand snapshot pool).
+    search_concurrency: int = Field(default=8, ge=1, le=64)
     # Dev-friendly default: reseed can easily require hundreds of queries even on small targets.
     daily_query_budget: int = 5000
     monthly_spend_limit_usd: float = 300.0
@@ -37,10 +45,30 @@ class Settings(BaseSettings):
     openrouter_strong_model: str = "anthropic/claude-3.5-sonnet"
     openrouter_max_input_tokens: int = Field(default=12000, ge=512, le=32000)
     openrouter_max_output_tokens: int = Field(default=1200, ge=128, le=8192)
+    # Identical chat turns against an unchanged brand profile reuse the previous model answer. 0 disables.
+    chat_cache_ttl_seconds: int = Field(default=900, ge=0, le=86400)
 
     reports_dir: str = "./reports/generated"
 
+    # Serialized /v1/feed responses are reused for this long; admin refresh/reseed clears them early. 0 disables.
+    feed_cache_ttl_seconds: int = Field(default=60, ge=0, le=3600)
 
-@lru_cache(maxsize=1)
-def get_settings() -> Settings:
-    return Settings()
+
+# Env parsing and validation stay on `Settings`; request-path code reads this plain slotted snapshot instead.
+RuntimeSettings = make_dataclass(
+    "RuntimeSettings",
+    [(name, field.annotation) for name, field in Settings.model_fields.items()],
+    frozen=True,
+    slots=True,
+)
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> RuntimeSettings:
+    return RuntimeSettings(**Settings().model_dump())
+
+
+@lru_cache(maxsize=None)
+def split_csv(value: str) -> tuple[str, ...]:
+    """Parse a comma-separated setting once; blanks and surrounding whitespace are dropped."""
+    return tuple(part for part in (item.strip() for item in value.split(",")) if part)
@@ -1,14 +1,55 @@
 from __future__ import annotations
 
-from sqlalchemy import inspect, text
-from sqlalchemy import create_engine
+import threading
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import Connection, Engine, make_url
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from .config import get_settings
+from .config import RuntimeSettings, get_settings
 
 settings = get_settings()
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+
+# Embedded backends never drop connections, so a liveness `SELECT 1` per checkout is wasted work.
+_NO_PRE_PING_BACKENDS = {"sqlite"}
+
+
+def _json_serializer(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+
+def _engine_kwargs(settings: RuntimeSettings) -> dict[str, Any]:
+    url = make_url(settings.database_url)
+    pool_pre_ping = url.get_backend_name() not in _NO_PRE_PING_BACKENDS
+    # JSON columns (e.g. Scorecard.confidence_reasons) round-trip through orjson instead of stdlib json.
+    json_kwargs: dict[str, Any] = {"json_serializer": _json_serializer, "json_deserializer": orjson.loads}
+    if url.get_backend_name() == "sqlite":
+        kwargs: dict[str, Any] = {
+            "connect_args": {"check_same_thread": False},
+            "pool_pre_ping": pool_pre_ping,
+            **json_kwargs,
+        }
+        # In-memory databases only exist on a single connection, so every checkout must share it.
+        if url.database in (None, "", ":memory:"):
+            kwargs["poolclass"] = StaticPool
+        return kwargs
+
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": pool_pre_ping,
+        **json_kwargs,
+    }
+
+
+engine = create_engine(settings.database_url, **_engine_kwargs(settings))
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
 Base = declarative_base()
 
@@ -21,20 +62,55 @@ def get_db() -> Session:
         db.close()
 
 
-def init_db() -> None:
-    from . import models  # noqa: F401
+def _table_columns(conn: Connection, table: str) -> set[str]:
+    # One round trip on the bundled dialects instead of the inspector's multi-query reflection.
+    if conn.dialect.name == "sqlite":
+        return {row[1] for row in conn.execute(text(f"PRAGMA table_info('{table}')"))}
+    if conn.dialect.name == "postgresql":
+        # Scoped to the default schema like the inspector; a same-named table elsewhere must not mask a missing column.
+        rows = conn.execute(
+            text(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = current_schema() AND table_name = :table"
+            ),
+            {"table": table},
+        )
+        return {row[0] for row in rows}
+    return {column["name"] for column in inspect(conn).get_columns(table)}
+
 
-    Base.metadata.create_all(bind=engine)
+@lru_cache(maxsize=1)
+def _apply_schema_drift(engine: Engine) -> None:
+    from . import models
 
     # Lightweight schema drift handling (no full migrations in this PoC).
     # We only add additive columns; destructive changes are intentionally avoided.
-    inspector = inspect(engine)
-    try:
-        brand_cols = {col["name"] for col in inspector.get_columns("brands")}
-    except Exception:
-        brand_cols = set()
-
-    if "entity_key" not in brand_cols:
-        with engine.begin() as conn:
+    with engine.begin() as conn:
+        brand_cols = _table_columns(conn, "brands")
+        if "entity_key" not in brand_cols:
             conn.execute(text("ALTER TABLE brands ADD COLUMN entity_key VARCHAR(140)"))
             conn.execute(text("UPDATE brands SET entity_key = '' WHERE entity_key IS NULL"))
+
+    # create_all() only builds indexes alongside new tables; add composite indexes to existing deployments too.
+    for model in (models.Scorecard, models.TimeSeriesPoint):
+        for index in model.__table__.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+_init_lock = threading.Lock()
+_initialized = False
+
+
+def init_db() -> None:
+    global _initialized
+    if _initialized:
+        return
+
+    from . import models  # noqa: F401
+
+    with _init_lock:
+        if _initialized:
+            return
+        Base.metadata.create_all(bind=engine)
+        _apply_schema_drift(engine)
+        _initialized = True
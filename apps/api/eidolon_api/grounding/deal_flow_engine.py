@@ -6,41 +6,48 @@ from dataclasses import dataclass
 GROUNDING_DOC_TITLE = "Deal Flow Engine - Brand Intelligence & Deal Sourcing Engine"
 
 # Distilled requirements from the source document.
-GROUNDING_PRINCIPLES = [
+GROUNDING_PRINCIPLES = (
     "Prioritize acceleration and rate-of-change over absolute scale.",
     "Use the workflow: Cultural signal -> Engagement analysis -> Financial inference -> Risk scan -> Structured outreach.",
     "Rank a weekly universe and generate deeper analysis for top opportunities.",
     "Combine cultural heat and financial asymmetry with explicit risk scanning.",
     "Generate structured recommendations and outreach-ready theses.",
-]
+)
 
-GROUNDING_OUTPUT_EXPECTATIONS = [
+GROUNDING_OUTPUT_EXPECTATIONS = (
     "Output confidence-scored heat, revenue range, capital intensity, risk profile, and asymmetry.",
     "Include stress scenarios such as CPM spikes and platform shocks.",
     "Surface suggested deal structures with clear reasoning.",
-]
+)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GroundingContext:
     title: str
-    principles: list[str]
-    output_expectations: list[str]
+    principles: tuple[str, ...]
+    output_expectations: tuple[str, ...]
+
+
+# Everything here derives from the constants above, so both values are materialized once at import.
+_GROUNDING_CONTEXT = GroundingContext(
+    title=GROUNDING_DOC_TITLE,
+    principles=GROUNDING_PRINCIPLES,
+    output_expectations=GROUNDING_OUTPUT_EXPECTATIONS,
+)
+
+GROUNDING_BLOCK = "\n".join(
+    [
+        "Workflow anchor:",
+        *(f"- {line}" for line in GROUNDING_PRINCIPLES),
+        "Outputs:",
+        *(f"- {line}" for line in GROUNDING_OUTPUT_EXPECTATIONS),
+    ]
+)
 
 
 def get_grounding_context() -> GroundingContext:
-    return GroundingContext(
-        title=GROUNDING_DOC_TITLE,
-        principles=list(GROUNDING_PRINCIPLES),
-        output_expectations=list(GROUNDING_OUTPUT_EXPECTATIONS),
-    )
+    return _GROUNDING_CONTEXT
 
 
 def format_grounding_block() -> str:
-    lines = [
-        "Workflow anchor:",
-        ]
-    lines.extend([f"- {line}" for line in GROUNDING_PRINCIPLES])
-    lines.append("Outputs:")
-    lines.extend([f"- {line}" for line in GROUNDING_OUTPUT_EXPECTATIONS])
-    return "\n".join(lines)
+    return GROUNDING_BLOCK
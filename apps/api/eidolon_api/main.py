@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 import datetime as dt
+from collections.abc import Iterator
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
-from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.orm import Session
 
+from .cache import TTLCache
 from .config import get_settings
 from .database import SessionLocal, get_db, init_db
 from .schemas import (
+    BrandProfile,
+    ChatBatchRequest,
+    ChatBatchResponse,
     ChatRequest,
     ChatResponse,
     DiscoverResponse,
@@ -30,6 +38,11 @@ from .services.simulation import run_simulation
 
 settings = get_settings()
 
+# Starlette compiles the regex once at startup and tries it before the origin set, so the set only needs to be
+# deduplicated (cors_origin usually repeats the localhost default) and hashable for O(1) membership checks.
+CORS_ALLOW_ORIGINS = frozenset({settings.cors_origin, "http://localhost:3000", "http://127.0.0.1:3000"})
+CORS_LOCAL_ORIGIN_REGEX = r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$"
+
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
@@ -42,25 +55,73 @@ async def lifespan(_: FastAPI):
         yield
     finally:
         db.close()
+        # Only close services that were actually built; calling the factories here would construct them.
+        if get_chat_service.cache_info().currsize:
+            await get_chat_service().aclose()
+        if get_router.cache_info().currsize:
+            get_router().close()
 
 
 app = FastAPI(title=settings.app_name, version="0.1.0", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[settings.cors_origin, "http://localhost:3000", "http://127.0.0.1:3000"],
-    allow_origin_regex=r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$",
+    allow_origins=CORS_ALLOW_ORIGINS,
+    allow_origin_regex=CORS_LOCAL_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-router = SourceRouter(settings=settings)
-report_service = ReportService(reports_dir=settings.reports_dir)
-chat_service = ChatService(settings=settings)
+_DATETIME_JSON = TypeAdapter(dt.datetime)
+
+
+def _json_response(model: BaseModel) -> Response:
+    # Pydantic's Rust serializer; skips FastAPI's jsonable_encoder walk + stdlib json.dumps on large payloads.
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _stream_report_batch(
+    db: Session,
+    artifacts: Iterator[ReportArtifact],
+    first: ReportArtifact | None,
+) -> Iterator[bytes]:
+    # Emits the ReportBatchArtifact document incrementally so only one artifact is in memory at a time.
+    # The generator outlives the request dependencies, so it owns (and closes) the DB session.
+    try:
+        yield b'{"generated_at":' + _DATETIME_JSON.dump_json(dt.datetime.now(dt.UTC)) + b',"reports":['
+        count = 0
+        if first is not None:
+            yield first.model_dump_json().encode()
+            count = 1
+            for artifact in artifacts:
+                yield b"," + artifact.model_dump_json().encode()
+                count += 1
+        yield b'],"count":' + str(count).encode() + b"}"
+    finally:
+        db.close()
+
+
+# Services are built on first use rather than at import, so reloads and forked workers only pay for what they serve.
+@lru_cache(maxsize=None)
+def get_router() -> SourceRouter:
+    return SourceRouter(settings=settings)
+
+
+@lru_cache(maxsize=None)
+def get_report_service() -> ReportService:
+    return ReportService(reports_dir=settings.reports_dir)
+
+
+@lru_cache(maxsize=None)
+def get_chat_service() -> ChatService:
+    return ChatService(settings=settings)
+
+
+feed_cache: TTLCache[bytes] = TTLCache(maxsize=64, ttl=settings.feed_cache_ttl_seconds)
 
 
 @app.get("/v1/health")
-def health() -> dict:
+def health(router: SourceRouter = Depends(get_router)) -> dict:
     return {
         "status": "ok",
         "budget": router.budget_snapshot(),
@@ -75,11 +136,19 @@ def feed(
     time_window: str = Query(default="12w", pattern="^(4w|12w|52w)$"),
     search: str | None = Query(default=None),
     db: Session = Depends(get_db),
-) -> FeedResponse:
-    try:
-        return build_feed(db=db, sort=sort, limit=limit, search=search, time_window=time_window)
-    except ValueError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
+) -> Response:
+    # build_feed always reads the latest snapshot week, so time_window does not change the result and stays out
+    # of the key; every window shares one cached entry.
+    key = (sort, limit, search)
+    content = feed_cache.get(key)
+    if content is None:
+        try:
+            feed_response = build_feed(db=db, sort=sort, limit=limit, search=search, time_window=time_window)
+        except ValueError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+        content = feed_response.model_dump_json().encode()
+        feed_cache.set(key, content)
+    return Response(content=content, media_type="application/json")
 
 
 @app.get("/v1/discover", response_model=DiscoverResponse)
@@ -87,17 +156,18 @@ def discover(
     industry: str = Query(..., min_length=2, max_length=120),
     region: str | None = Query(default=None, min_length=2, max_length=120),
     limit: int = Query(default=12, ge=1, le=50),
-) -> DiscoverResponse:
+    router: SourceRouter = Depends(get_router),
+) -> Response:
     try:
-        return discover_companies(router=router, industry=industry, region=region, limit=limit)
+        return _json_response(discover_companies(router=router, industry=industry, region=region, limit=limit))
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
-@app.get("/v1/brand/{brand_id}")
-def brand_detail(brand_id: str, db: Session = Depends(get_db)):
+@app.get("/v1/brand/{brand_id}", response_model=BrandProfile)
+def brand_detail(brand_id: str, db: Session = Depends(get_db)) -> Response:
     try:
-        return build_brand_profile(db=db, brand_id=brand_id)
+        return _json_response(build_brand_profile(db=db, brand_id=brand_id))
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
@@ -108,14 +178,18 @@ def brand_timeseries(brand_id: str, db: Session = Depends(get_db)):
 
 
 @app.post("/v1/simulate", response_model=ScenarioResult)
-def simulate(req: SimulateRequest) -> ScenarioResult:
-    return run_simulation(req)
+def simulate(req: SimulateRequest) -> Response:
+    return _json_response(run_simulation(req))
 
 
 @app.post("/v1/report", response_model=ReportArtifact)
-def report(req: ReportRequest, db: Session = Depends(get_db)) -> ReportArtifact:
+def report(
+    req: ReportRequest,
+    db: Session = Depends(get_db),
+    report_service: ReportService = Depends(get_report_service),
+) -> Response:
     try:
-        return report_service.generate(db=db, req=req)
+        return _json_response(report_service.generate(db=db, req=req))
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
@@ -123,22 +197,44 @@ def report(req: ReportRequest, db: Session = Depends(get_db)) -> ReportArtifact:
 @app.post("/v1/report/top", response_model=ReportBatchArtifact)
 def report_top(
     limit: int = Query(default=20, ge=1, le=50),
-    db: Session = Depends(get_db),
-) -> ReportBatchArtifact:
-    artifacts = report_service.generate_top_ranked(db=db, limit=limit)
-    return ReportBatchArtifact(
-        generated_at=dt.datetime.now(dt.UTC),
-        count=len(artifacts),
-        reports=artifacts,
-    )
+    report_service: ReportService = Depends(get_report_service),
+) -> StreamingResponse:
+    # Rank, load profiles and render the first artifact before any bytes are sent, so setup failures still
+    # surface as an error status instead of a truncated 200 body.
+    db = SessionLocal()
+    try:
+        artifacts = report_service.iter_top_ranked(db=db, limit=limit)
+        first = next(artifacts, None)
+    except BaseException:
+        db.close()
+        raise
+    return StreamingResponse(_stream_report_batch(db, artifacts, first), media_type="application/json")
 
 
 @app.post("/v1/chat", response_model=ChatResponse)
-def chat(req: ChatRequest, db: Session = Depends(get_db)) -> ChatResponse:
+async def chat(
+    req: ChatRequest,
+    db: Session = Depends(get_db),
+    chat_service: ChatService = Depends(get_chat_service),
+) -> Response:
+    try:
+        content = await chat_service.chat_json(db=db, req=req)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return Response(content=content, media_type="application/json")
+
+
+@app.post("/v1/chat/batch", response_model=ChatBatchResponse)
+async def chat_batch(
+    req: ChatBatchRequest,
+    db: Session = Depends(get_db),
+    chat_service: ChatService = Depends(get_chat_service),
+) -> Response:
     try:
-        return chat_service.chat(db=db, req=req)
+        responses = await chat_service.chat_batch(db=db, reqs=req.requests)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return _json_response(ChatBatchResponse(count=len(responses), responses=responses))
 
 
 @app.post("/v1/admin/refresh")
@@ -146,8 +242,10 @@ def refresh(
     target_brands: int = Query(default=200, ge=20, le=500),
     enrich_top_n: int = Query(default=30, ge=0, le=200),
     db: Session = Depends(get_db),
+    router: SourceRouter = Depends(get_router),
 ) -> dict:
     result = refresh_universe_snapshot(db=db, router=router, target_brands=target_brands, enrich_top_n=enrich_top_n)
+    feed_cache.clear()
     return {"status": "ok", "message": "Universe refreshed.", **result}
 
 
@@ -156,6 +254,8 @@ def reseed(
     target_brands: int = Query(default=200, ge=20, le=500),
     enrich_top_n: int = Query(default=30, ge=0, le=200),
     db: Session = Depends(get_db),
+    router: SourceRouter = Depends(get_router),
 ) -> dict:
     result = reseed_universe(db=db, router=router, target_brands=target_brands, enrich_top_n=enrich_top_n)
+    feed_cache.clear()
     return {"status": "ok", "message": "Universe rebuilt.", **result}
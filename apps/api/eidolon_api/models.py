@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import datetime as dt
 
-from sqlalchemy import Date, DateTime, Float, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import Date, DateTime, Float, ForeignKey, Index, Integer, JSON, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .database import Base
@@ -20,14 +20,22 @@ class Brand(Base):
     website: Mapped[str] = mapped_column(String(255))
     description: Mapped[str] = mapped_column(Text)
 
-    scorecards: Mapped[list[Scorecard]] = relationship(back_populates="brand", cascade="all, delete-orphan")
-    timeseries_points: Mapped[list[TimeSeriesPoint]] = relationship(back_populates="brand", cascade="all, delete-orphan")
-    evidence_items: Mapped[list[EvidenceCitation]] = relationship(back_populates="brand", cascade="all, delete-orphan")
-    reports: Mapped[list[GeneratedReport]] = relationship(back_populates="brand", cascade="all, delete-orphan")
+    scorecards: Mapped[list[Scorecard]] = relationship(back_populates="brand", cascade="all, delete-orphan", lazy="raise")
+    timeseries_points: Mapped[list[TimeSeriesPoint]] = relationship(back_populates="brand", cascade="all, delete-orphan", lazy="raise")
+    evidence_items: Mapped[list[EvidenceCitation]] = relationship(back_populates="brand", cascade="all, delete-orphan", lazy="raise")
+    reports: Mapped[list[GeneratedReport]] = relationship(back_populates="brand", cascade="all, delete-orphan", lazy="raise")
 
 
 class Scorecard(Base):
     __tablename__ = "scorecards"
+    # /v1/feed filters on one snapshot week and orders by the selected sort column.
+    __table_args__ = (
+        Index("ix_scorecards_week_heat", "snapshot_week", "heat_score"),
+        Index("ix_scorecards_week_asym", "snapshot_week", "asymmetry_index"),
+        Index("ix_scorecards_week_risk", "snapshot_week", "risk_score"),
+        Index("ix_scorecards_week_rev", "snapshot_week", "revenue_p50"),
+        Index("ix_scorecards_week_cap", "snapshot_week", "capital_required_musd"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     brand_id: Mapped[str] = mapped_column(String(64), ForeignKey("brands.id"), index=True)
@@ -54,6 +62,7 @@ class Scorecard(Base):
 
 class TimeSeriesPoint(Base):
     __tablename__ = "timeseries_points"
+    __table_args__ = (Index("ix_timeseries_brand_metric_observed", "brand_id", "metric", "observed_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     brand_id: Mapped[str] = mapped_column(String(64), ForeignKey("brands.id"), index=True)
@@ -3,13 +3,17 @@ from __future__ import annotations
 import datetime as dt
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 SortMode = Literal["heat", "asymmetry", "risk", "revenue", "capital_required"]
 
 
+# Response-only models are frozen: they are never mutated after construction and become hashable
+# whenever all of their fields are.
 class EvidenceCitation(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     title: str
     url: str
     source: str
@@ -18,11 +22,15 @@ class EvidenceCitation(BaseModel):
 
 
 class ConfidenceEnvelope(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     overall: float = Field(..., ge=0, le=1)
     reasons: list[str]
 
 
 class ScoreCard(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     snapshot_week: dt.date
     heat_score: float
     risk_score: float
@@ -38,6 +46,8 @@ class ScoreCard(BaseModel):
 
 
 class BrandSummary(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     rank: int
     brand_id: str
     name: str
@@ -61,6 +71,8 @@ class FeedResponse(BaseModel):
 
 
 class BrandData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     category: str
@@ -70,6 +82,8 @@ class BrandData(BaseModel):
 
 
 class ProductionSnapshot(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     current_model: str
     unit_economics_pressure: str
     bottlenecks: list[str]
@@ -77,6 +91,8 @@ class ProductionSnapshot(BaseModel):
 
 
 class ProductionOption(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     option_name: str
     mode: str
     estimated_savings_pct: float = Field(..., ge=0, le=60)
@@ -87,6 +103,8 @@ class ProductionOption(BaseModel):
 
 
 class CostOpportunity(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     title: str
     lever: str
     estimated_savings_pct_low: float = Field(..., ge=0, le=60)
@@ -96,6 +114,8 @@ class CostOpportunity(BaseModel):
 
 
 class SignalPoint(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     metric: str
     current: float
     delta_12w: float
@@ -103,6 +123,8 @@ class SignalPoint(BaseModel):
 
 
 class DataCollectionLayerSnapshot(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     social_signals: list[SignalPoint]
     commerce_signals: list[SignalPoint]
     search_cultural_signals: list[SignalPoint]
@@ -110,6 +132,8 @@ class DataCollectionLayerSnapshot(BaseModel):
 
 
 class EngagementBreakdown(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     comments_to_likes_ratio: float = Field(..., ge=0, le=1)
     repeat_commenter_density: float = Field(..., ge=0, le=1)
     ugc_depth_score: float = Field(..., ge=0, le=100)
@@ -119,6 +143,8 @@ class EngagementBreakdown(BaseModel):
 
 
 class FinancialInferenceModel(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     traffic_estimate_kmo: float = Field(..., ge=0)
     conversion_assumption_pct: float = Field(..., ge=0, le=100)
     average_order_value_usd: float = Field(..., ge=0)
@@ -132,6 +158,8 @@ class FinancialInferenceModel(BaseModel):
 
 
 class RiskScanSummary(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     trademark_strength: Literal["weak", "moderate", "strong"]
     corporate_registry_verified: bool
     litigation_flags: list[str]
@@ -143,6 +171,8 @@ class RiskScanSummary(BaseModel):
 
 
 class DealStructuringPlan(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     suggested_entry_strategy: str
     suggested_ownership_target_pct: str
     estimated_capital_required_musd: float = Field(..., ge=0)
@@ -168,6 +198,8 @@ class BrandProfile(BaseModel):
 
 
 class TimeSeriesPoint(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     metric: str
     observed_at: dt.date
     value: float
@@ -187,6 +219,8 @@ class SimulateRequest(BaseModel):
 
 
 class PercentileBand(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     p10: float
     p50: float
     p90: float
@@ -278,3 +312,12 @@ class ChatResponse(BaseModel):
     confidence: float = Field(..., ge=0, le=1)
     citations: list[EvidenceCitation]
     model: str
+
+
+class ChatBatchRequest(BaseModel):
+    requests: list[ChatRequest] = Field(..., min_length=1, max_length=20)
+
+
+class ChatBatchResponse(BaseModel):
+    count: int
+    responses: list[ChatResponse]
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
 import datetime as dt
+import heapq
 import re
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from statistics import median
-from urllib.parse import urlparse
+
+import numpy as np
 
 from .. import schemas
 from .providers.router import SourceRouter
 
 TITLE_SPLIT_RE = re.compile(r"\s[-|:]\s")
-WORD_RE = re.compile(r"[a-z0-9]+")
+WORD_RE = re.compile(r"[a-z0-9]{3,}")
+_WS_RE = re.compile(r"\s+")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_NON_ALNUM_SPACE_RE = re.compile(r"[^a-z0-9 ]+")
+# Optional scheme followed by an authority, as urlsplit recognises them.
+_NETLOC_RE = re.compile(r"(?:[A-Za-z][A-Za-z0-9+.-]*:)?//([^/?#]*)")
 
 SOURCE_RELIABILITY = {
     "reddit": 0.72,
@@ -21,104 +31,117 @@ SOURCE_RELIABILITY = {
     "duckduckgo": 0.64,
 }
 
-MOMENTUM_TERMS = {
-    "growth",
-    "surge",
-    "expansion",
-    "viral",
-    "record",
-    "raised",
-    "launch",
-    "partnership",
-    "opening",
-    "scale",
-    "scaled",
-    "momentum",
-}
-
-RISK_TERMS = {
-    "lawsuit",
-    "recall",
-    "decline",
-    "bankrupt",
-    "shutdown",
-    "layoff",
-    "controversy",
-    "investigation",
-    "ban",
-    "fraud",
-    "default",
-    "warning",
-}
-
-GENERIC_NAME_TERMS = {
-    "best",
-    "top",
-    "guide",
-    "list",
-    "trend",
-    "trends",
-    "market",
-    "markets",
-    "industry",
-    "insights",
-    "news",
-    "review",
-    "reviews",
-    "analysis",
-    "report",
-    "reports",
-    "companies",
-    "brands",
-    "consumer",
-    "startup",
-    "startups",
-}
-
-LEGAL_SUFFIXES = {
-    "inc",
-    "llc",
-    "ltd",
-    "co",
-    "company",
-    "corp",
-    "corporation",
-    "plc",
-    "gmbh",
-    "srl",
-}
-
-PUBLISHER_HOST_HINTS = {
-    "forbes",
-    "techcrunch",
-    "wikipedia",
-    "reddit",
-    "youtube",
-    "linkedin",
-    "substack",
-    "bloomberg",
-    "fortune",
-    "medium",
-    "nytimes",
-    "wsj",
-    "businessinsider",
-    "theverge",
-    "axios",
-}
+MOMENTUM_TERMS = frozenset(
+    {
+        "growth",
+        "surge",
+        "expansion",
+        "viral",
+        "record",
+        "raised",
+        "launch",
+        "partnership",
+        "opening",
+        "scale",
+        "scaled",
+        "momentum",
+    }
+)
+
+RISK_TERMS = frozenset(
+    {
+        "lawsuit",
+        "recall",
+        "decline",
+        "bankrupt",
+        "shutdown",
+        "layoff",
+        "controversy",
+        "investigation",
+        "ban",
+        "fraud",
+        "default",
+        "warning",
+    }
+)
+
+GENERIC_NAME_TERMS = frozenset(
+    {
+        "best",
+        "top",
+        "guide",
+        "list",
+        "trend",
+        "trends",
+        "market",
+        "markets",
+        "industry",
+        "insights",
+        "news",
+        "review",
+        "reviews",
+        "analysis",
+        "report",
+        "reports",
+        "companies",
+        "brands",
+        "consumer",
+        "startup",
+        "startups",
+    }
+)
+
+LEGAL_SUFFIXES = frozenset(
+    {
+        "inc",
+        "llc",
+        "ltd",
+        "co",
+        "company",
+        "corp",
+        "corporation",
+        "plc",
+        "gmbh",
+        "srl",
+    }
+)
+
+PUBLISHER_HOST_HINTS = frozenset(
+    {
+        "forbes",
+        "techcrunch",
+        "wikipedia",
+        "reddit",
+        "youtube",
+        "linkedin",
+        "substack",
+        "bloomberg",
+        "fortune",
+        "medium",
+        "nytimes",
+        "wsj",
+        "businessinsider",
+        "theverge",
+        "axios",
+    }
+)
+_PUBLISHER_HOST_RE = re.compile("|".join(re.escape(hint) for hint in sorted(PUBLISHER_HOST_HINTS)))
 
 
 def _clean_text(value: str) -> str:
-    return re.sub(r"\s+", " ", value.strip())
+    return _WS_RE.sub(" ", value.strip())
 
 
 def _tokenize(value: str) -> set[str]:
-    return {tok for tok in WORD_RE.findall(value.lower()) if len(tok) >= 3}
+    return set(WORD_RE.findall(value.lower()))
 
 
-def _clamp(value: float, low: float, high: float) -> float:
-    return max(low, min(high, value))
+@lru_cache(maxsize=512)
+def _keyword_tokens(value: str) -> frozenset[str]:
+    return frozenset(_tokenize(value))
 
 
+@lru_cache(maxsize=256)
 def _source_weight(source: str) -> float:
     lowered = source.lower()
     for key, value in SOURCE_RELIABILITY.items():
@@ -127,8 +150,15 @@ def _source_weight(source: str) -> float:
     return 0.58
 
 
-def _domain_label(url: str) -> str:
-    host = (urlparse(url).netloc or "").lower().split(":", 1)[0]
+def _netloc(url: str) -> str:
+    """Lowercased `urlparse(url).netloc` without building the full parse result."""
+    match = _NETLOC_RE.match(url)
+    return match.group(1).lower() if match else ""
+
+
+@lru_cache(maxsize=2048)
+def _domain_label(netloc: str) -> str:
+    host = netloc.split(":", 1)[0]
     if not host:
         return ""
     parts = [p for p in host.split(".") if p and p != "www"]
@@ -140,7 +170,7 @@ def _domain_label(url: str) -> str:
         core = parts[-2]
     else:
         core = parts[0]
-    return re.sub(r"[^a-z0-9]+", " ", core).strip()
+    return _NON_ALNUM_RE.sub(" ", core).strip()
 
 
 def _title_case_words(value: str) -> str:
@@ -148,12 +178,10 @@ def _title_case_words(value: str) -> str:
     return " ".join(w.capitalize() for w in words)
 
 
+@lru_cache(maxsize=2048)
 def _normalize_company_name(name: str) -> str:
-    cleaned = re.sub(r"[^a-z0-9 ]+", " ", name.lower())
-    tokens = [tok for tok in cleaned.split() if tok and tok not in LEGAL_SUFFIXES]
-    if len(tokens) > 6:
-        tokens = tokens[:6]
-    return " ".join(tokens)
+    cleaned = _NON_ALNUM_SPACE_RE.sub(" ", name.lower())
+    return " ".join(islice((tok for tok in cleaned.split() if tok not in LEGAL_SUFFIXES), 6))
 
 
 def _is_generic_name(norm_name: str) -> bool:
@@ -166,53 +194,54 @@ def _is_generic_name(norm_name: str) -> bool:
     return generic_hits >= max(1, len(tokens) // 2)
 
 
-def _is_publisher_host(url: str) -> bool:
-    host = (urlparse(url).netloc or "").lower()
-    return any(hint in host for hint in PUBLISHER_HOST_HINTS)
+def _is_publisher_host(netloc: str) -> bool:
+    return _PUBLISHER_HOST_RE.search(netloc) is not None
 
 
 def _name_guess_from_title(title: str) -> str:
     cleaned = _clean_text(title)
     if not cleaned:
         return "Unknown"
-    parts = TITLE_SPLIT_RE.split(cleaned)
-    guess = parts[0] if parts else cleaned
-    words = guess.split()
+    separator = TITLE_SPLIT_RE.search(cleaned)
+    guess = cleaned[: separator.start()] if separator else cleaned
+    words = guess.split(maxsplit=7)
     if len(words) > 7:
         guess = " ".join(words[:7])
     return guess
 
 
-def _derive_company_name(title: str, url: str) -> str:
+def _derive_company_name(title: str, netloc: str, domain_label: str) -> str:
     guess = _name_guess_from_title(title)
     norm_guess = _normalize_company_name(guess)
-    domain_name = _title_case_words(_domain_label(url))
+    domain_name = _title_case_words(domain_label)
 
     if _is_generic_name(norm_guess):
-        if domain_name and not _is_publisher_host(url):
+        if domain_name and not _is_publisher_host(netloc):
             return domain_name
         return guess
     return guess
 
 
-def _entity_key(company_name: str, url: str) -> str:
+@lru_cache(maxsize=2048)
+def _entity_key(company_name: str, domain_label: str) -> str:
     norm_name = _normalize_company_name(company_name)
-    domain = _normalize_company_name(_domain_label(url))
+    domain = _normalize_company_name(domain_label)
     if not norm_name or _is_generic_name(norm_name):
         return f"domain:{domain or 'unknown'}"
     short = " ".join(norm_name.split()[:3])
     return f"name:{short}"
 
 
-def _query_plan(industry: str, region: str | None) -> list[str]:
+@lru_cache(maxsize=512)
+def _query_plan(industry: str, region: str | None) -> tuple[str, ...]:
     geo = f" {region}" if region else ""
     industry_clean = _clean_text(industry)
-    return [
+    return (
         f"emerging {industry_clean} consumer brand{geo}",
         f"{industry_clean} d2c brand growth{geo}",
         f"{industry_clean} startup retail expansion{geo}",
         f"{industry_clean} founder-led company momentum{geo}",
-    ]
+    )
 
 
 def _estimated_revenue_band(fit: float, momentum: float) -> str:
@@ -238,46 +267,101 @@ def _deal_structure(fit: float, momentum: float, risk: float, asymmetry: float)
     return "Control acquisition"
 
 
+# Checked in order; the first matching category wins.
+_COST_DOWN_ANGLES = (
+    (
+        re.compile(r"beauty|skin|cosmetic|personal care"),
+        "Contract fill-finish rebid plus packaging simplification to compress COGS.",
+    ),
+    (
+        re.compile(r"food|beverage|snack"),
+        "Co-packer lane optimization and ingredient contract rebid for procurement savings.",
+    ),
+    (
+        re.compile(r"apparel|fashion|outdoor"),
+        "Supplier portfolio rebalance with regionalized finishing to reduce material and freight pressure.",
+    ),
+    (
+        re.compile(r"home|furniture"),
+        "SKU architecture cleanup and 3PL lane optimization to lower landed cost volatility.",
+    ),
+    (
+        re.compile(r"tech|electronics"),
+        "OEM repricing and component dual-sourcing to lower unit cost risk.",
+    ),
+)
+
+
+@lru_cache(maxsize=256)
 def _production_cost_down_angle(industry: str) -> str:
     i = industry.lower()
-    if "beauty" in i or "skin" in i or "cosmetic" in i or "personal care" in i:
-        return "Contract fill-finish rebid plus packaging simplification to compress COGS."
-    if "food" in i or "beverage" in i or "snack" in i:
-        return "Co-packer lane optimization and ingredient contract rebid for procurement savings."
-    if "apparel" in i or "fashion" in i or "outdoor" in i:
-        return "Supplier portfolio rebalance with regionalized finishing to reduce material and freight pressure."
-    if "home" in i or "furniture" in i:
-        return "SKU architecture cleanup and 3PL lane optimization to lower landed cost volatility."
-    if "tech" in i or "electronics" in i:
-        return "OEM repricing and component dual-sourcing to lower unit cost risk."
+    for pattern, angle in _COST_DOWN_ANGLES:
+        if pattern.search(i):
+            return angle
     return "Strategic contract rebid and regional fulfillment optimization as primary cost-down lever."
 
 
-def _score_company(
+def _score_features(
     candidate: schemas.DiscoveryCandidate,
-    company_name: str,
-    industry: str,
-    region: str | None,
-) -> schemas.DiscoveryCompanyReport:
-    text = _clean_text(f"{company_name} {candidate.title} {candidate.snippet} {candidate.query}").lower()
-    text_tokens = _tokenize(text)
-    industry_tokens = _tokenize(industry)
-    region_tokens = _tokenize(region or "")
+    industry_tokens: frozenset[str],
+    region_tokens: frozenset[str],
+) -> tuple[float, float, float, int, int]:
+    text_tokens = _tokenize(f"{candidate.name_guess} {candidate.title} {candidate.snippet} {candidate.query}")
 
     industry_overlap = len(text_tokens & industry_tokens) / max(1, len(industry_tokens))
     region_overlap = len(text_tokens & region_tokens) / max(1, len(region_tokens)) if region_tokens else 0.0
 
     source_weight = _source_weight(candidate.source)
 
-    momentum_hits = sum(1 for t in MOMENTUM_TERMS if t in text_tokens)
-    risk_hits = sum(1 for t in RISK_TERMS if t in text_tokens)
-
-    fit_score = _clamp(42 + industry_overlap * 42 + region_overlap * 10 + source_weight * 10, 5, 99)
-    momentum_score = _clamp(34 + momentum_hits * 8 + source_weight * 22, 5, 99)
-    risk_score = _clamp(20 + risk_hits * 15 + (1 - source_weight) * 18, 5, 98)
-    asymmetry_score = _clamp(fit_score * 0.5 + momentum_score * 0.35 - risk_score * 0.23 + 19, 5, 98)
-
-    confidence = _clamp(0.42 + source_weight * 0.35 + fit_score / 260 + momentum_score / 320 - risk_score / 700, 0.3, 0.94)
+    momentum_hits = len(MOMENTUM_TERMS & text_tokens)
+    risk_hits = len(RISK_TERMS & text_tokens)
+    return industry_overlap, region_overlap, source_weight, momentum_hits, risk_hits
+
+
+def _score_matrix(features: list[tuple[float, float, float, int, int]]) -> np.ndarray:
+    """Score every candidate at once; columns are fit, momentum, risk, asymmetry and confidence."""
+    industry_overlap, region_overlap, source_weight, momentum_hits, risk_hits = np.asarray(features, dtype=float).T
+
+    fit = np.clip(42 + industry_overlap * 42 + region_overlap * 10 + source_weight * 10, 5, 99)
+    momentum = np.clip(34 + momentum_hits * 8 + source_weight * 22, 5, 99)
+    risk = np.clip(20 + risk_hits * 15 + (1 - source_weight) * 18, 5, 98)
+    asymmetry = np.clip(fit * 0.5 + momentum * 0.35 - risk * 0.23 + 19, 5, 98)
+
+    confidence = np.clip(0.42 + source_weight * 0.35 + fit / 260 + momentum / 320 - risk / 700, 0.3, 0.94)
+    return np.column_stack((fit, momentum, risk, asymmetry, confidence))
+
+
+_NEXT_STEP = (
+    "Run full dossier pull: engagement breakdown, financial inference, risk scan, and founder outreach draft before outreach."
+)
+_STANDING_RISKS = (
+    "Platform/channel concentration may amplify volatility; map channel mix and dependency caps.",
+    "Supplier concentration and lead-time risk should be stress-tested under demand acceleration.",
+)
+_DILIGENCE_QUESTIONS = (
+    "What is the verified 12-month net revenue and gross margin trend by channel?",
+    "Which suppliers represent >20% of COGS and what alternate capacity exists?",
+    "What founder priorities are non-negotiable in ownership and governance design?",
+)
+_COST_DOWN_ACTIONS = (
+    "Run strategic contract rebid across top spend categories and key manufacturing nodes.",
+    "Regionalize fulfillment lanes to reduce freight volatility and shorten lead times.",
+    "Simplify SKU and packaging architecture to reduce MOQ drag and conversion complexity.",
+)
+_EXECUTION_PLAN_30_60_90 = (
+    "30d: build COGS baseline, supplier map, and channel economics view.",
+    "60d: launch targeted RFPs, pilot dual-source options, and validate savings assumptions.",
+    "90d: lock negotiated terms, rollout winning lanes, and track realized savings versus plan.",
+)
+
+
+def _build_company_report(
+    candidate: schemas.DiscoveryCandidate,
+    industry: str,
+    scores: list[float],
+) -> schemas.DiscoveryCompanyReport:
+    company_name = candidate.name_guess
+    fit_score, momentum_score, risk_score, asymmetry_score, confidence = scores
 
     revenue_band = _estimated_revenue_band(fit_score, momentum_score)
     structure = _deal_structure(fit_score, momentum_score, risk_score, asymmetry_score)
@@ -288,28 +372,9 @@ def _score_company(
         f"Asymmetry is estimated at {asymmetry_score:.1f} with risk {risk_score:.1f}; "
         f"best initial structure is {structure.lower()}."
     )
-    next_step = (
-        "Run full dossier pull: engagement breakdown, financial inference, risk scan, and founder outreach draft before outreach."
-    )
     key_risks = [
         f"Signal-derived risk score sits at {risk_score:.1f}; validate legal/IP perimeter before term-sheet motion.",
-        "Platform/channel concentration may amplify volatility; map channel mix and dependency caps.",
-        "Supplier concentration and lead-time risk should be stress-tested under demand acceleration.",
-    ]
-    diligence_questions = [
-        "What is the verified 12-month net revenue and gross margin trend by channel?",
-        "Which suppliers represent >20% of COGS and what alternate capacity exists?",
-        "What founder priorities are non-negotiable in ownership and governance design?",
-    ]
-    operational_cost_down_actions = [
-        "Run strategic contract rebid across top spend categories and key manufacturing nodes.",
-        "Regionalize fulfillment lanes to reduce freight volatility and shorten lead times.",
-        "Simplify SKU and packaging architecture to reduce MOQ drag and conversion complexity.",
-    ]
-    execution_plan_30_60_90 = [
-        "30d: build COGS baseline, supplier map, and channel economics view.",
-        "60d: launch targeted RFPs, pilot dual-source options, and validate savings assumptions.",
-        "90d: lock negotiated terms, rollout winning lanes, and track realized savings versus plan.",
+        *_STANDING_RISKS,
     ]
 
     return schemas.DiscoveryCompanyReport(
@@ -324,31 +389,44 @@ def _score_company(
         suggested_deal_structure=structure,
         production_cost_down_angle=cost_down,
         opportunity_thesis=opportunity,
-        next_step=next_step,
+        next_step=_NEXT_STEP,
         key_risks=key_risks,
-        diligence_questions=diligence_questions,
-        operational_cost_down_actions=operational_cost_down_actions,
-        execution_plan_30_60_90=execution_plan_30_60_90,
+        diligence_questions=_DILIGENCE_QUESTIONS,
+        operational_cost_down_actions=_COST_DOWN_ACTIONS,
+        execution_plan_30_60_90=_EXECUTION_PLAN_30_60_90,
         confidence=round(confidence, 3),
     )
 
 
-def _report_rank(report: schemas.DiscoveryCompanyReport) -> float:
-    return report.fit_score * 0.45 + report.asymmetry_score * 0.35 + report.confidence * 20 - report.risk_score * 0.2
+@dataclass(slots=True)
+class _ScoredCandidate:
+    """Ranking view of a candidate; the full report is only rendered for the ones that are returned."""
+
+    candidate: schemas.DiscoveryCandidate
+    scores: list[float]
+    fit_score: float
+    risk_score: float
+    asymmetry_score: float
+
+    @property
+    def name(self) -> str:
+        return self.candidate.name_guess
 
 
 def _build_top_signals(
-    reports: list[schemas.DiscoveryCompanyReport],
+    reports: list[_ScoredCandidate],
+    leaders: list[_ScoredCandidate],
     provider_attempts: list[str],
 ) -> list[str]:
     successful_attempts = [row for row in provider_attempts if not row.endswith("=> none")]
     if not reports:
         return ["No strong candidate signals yet."]
 
-    median_fit = median([r.fit_score for r in reports])
-    median_risk = median([r.risk_score for r in reports])
-    median_asym = median([r.asymmetry_score for r in reports])
-    top = reports[0]
+    fits, risks, asyms = zip(*((r.fit_score, r.risk_score, r.asymmetry_score) for r in reports))
+    median_fit = median(fits)
+    median_risk = median(risks)
+    median_asym = median(asyms)
+    top = leaders[0]
 
     return [
         f"Successful query lanes: {len(successful_attempts)}/{len(provider_attempts)}.",
@@ -360,13 +438,14 @@ def _build_top_signals(
 def _build_narrative(
     industry: str,
     region: str | None,
-    reports: list[schemas.DiscoveryCompanyReport],
+    reports: list[_ScoredCandidate],
+    leaders: list[_ScoredCandidate],
 ) -> str:
     if not reports:
         geo = f" in {region}" if region else ""
         return f"No high-confidence companies found for {industry}{geo}. Try broader terms or remove region filter."
 
-    top = reports[:3]
+    top = leaders[:3]
     names = ", ".join(r.name for r in top)
     geo = f" in {region}" if region else ""
     return (
@@ -389,9 +468,14 @@ def discover_companies(
     queries = _query_plan(industry=industry_clean, region=region_clean)
     per_query = max(3, min(10, (limit + len(queries) - 1) // len(queries)))
 
+    industry_tokens = _keyword_tokens(industry_clean)
+    region_tokens = _keyword_tokens(region_clean or "")
+
     provider_attempts: list[str] = []
-    raw_rows: list[schemas.DiscoveryCandidate] = []
+    candidates: list[schemas.DiscoveryCandidate] = []
+    seen_entities: set[str] = set()
     seen_keys: set[str] = set()
+    accepted = 0
 
     for query in queries:
         provider, results = router.search(query=query, limit=per_query)
@@ -400,72 +484,68 @@ def discover_companies(
         for result in results:
             url = _clean_text(result.url)
             title = _clean_text(result.title)
-            snippet = _clean_text(result.snippet)
             if not url or not title:
                 continue
 
-            parsed = urlparse(url)
-            dedupe_key = f"{parsed.netloc.lower()}|{title.lower()}"
+            netloc = _netloc(url)
+            dedupe_key = f"{netloc}|{title.lower()}"
             if dedupe_key in seen_keys:
                 continue
             seen_keys.add(dedupe_key)
-
-            company_name = _derive_company_name(title, url)
-
-            raw_rows.append(
-                schemas.DiscoveryCandidate(
-                    name_guess=company_name,
-                    title=title,
-                    url=url,
-                    snippet=snippet,
-                    source=result.source,
-                    query=query,
+            accepted += 1
+
+            # The first result for an entity wins; later ones only count towards the result budget.
+            domain_label = _domain_label(netloc)
+            company_name = _derive_company_name(title, netloc, domain_label)
+            entity_key = _entity_key(company_name, domain_label)
+            if entity_key not in seen_entities:
+                seen_entities.add(entity_key)
+                candidates.append(
+                    schemas.DiscoveryCandidate(
+                        name_guess=company_name,
+                        title=title,
+                        url=url,
+                        snippet=_clean_text(result.snippet),
+                        source=result.source,
+                        query=query,
+                    )
                 )
-            )
 
-            if len(raw_rows) >= limit:
+            if accepted >= limit:
                 break
-        if len(raw_rows) >= limit:
+        if accepted >= limit:
             break
 
-    raw_unique_rows: list[schemas.DiscoveryCandidate] = []
-    seen_entity_rows: set[str] = set()
-    for row in raw_rows:
-        entity_key = _entity_key(row.name_guess, row.url)
-        if entity_key in seen_entity_rows:
-            continue
-        seen_entity_rows.add(entity_key)
-        raw_unique_rows.append(row)
-
-    deduped_reports: dict[str, schemas.DiscoveryCompanyReport] = {}
-    for row in raw_unique_rows:
-        key = _entity_key(row.name_guess, row.url)
-        report = _score_company(row, company_name=row.name_guess, industry=industry_clean, region=region_clean)
-
-        if key not in deduped_reports:
-            deduped_reports[key] = report
-            continue
-
-        if _report_rank(report) > _report_rank(deduped_reports[key]):
-            deduped_reports[key] = report
-
-    company_reports = list(deduped_reports.values())
-    company_reports.sort(key=lambda r: (r.fit_score, r.asymmetry_score, -r.risk_score), reverse=True)
+    scored: list[_ScoredCandidate] = []
+    if candidates:
+        features = [_score_features(row, industry_tokens, region_tokens) for row in candidates]
+        scored = [
+            _ScoredCandidate(row, scores, round(scores[0], 2), round(scores[2], 2), round(scores[3], 2))
+            for row, scores in zip(candidates, _score_matrix(features).tolist())
+        ]
+    report_count = max(1, min(10, limit))
+    # Only the returned reports and the narrative's top three need ordering; medians use every candidate.
+    leaders = heapq.nlargest(
+        max(3, report_count), scored, key=lambda r: (r.fit_score, r.asymmetry_score, -r.risk_score)
+    )
 
-    top_signals = _build_top_signals(company_reports, provider_attempts)
-    narrative = _build_narrative(industry_clean, region_clean, company_reports)
+    top_signals = _build_top_signals(scored, leaders, provider_attempts)
+    narrative = _build_narrative(industry_clean, region_clean, scored, leaders)
+    company_reports = [
+        _build_company_report(row.candidate, industry_clean, row.scores) for row in leaders[:report_count]
+    ]
 
     return schemas.DiscoverResponse(
         generated_at=dt.datetime.now(dt.UTC),
         industry=industry_clean,
         region=region_clean,
         provider_attempts=provider_attempts,
-        items=raw_unique_rows[:limit],
+        items=candidates,
         report=schemas.IndustryReport(
             industry=industry_clean,
             region=region_clean,
             narrative=narrative,
             top_signals=top_signals,
-            company_reports=company_reports[: max(1, min(10, limit))],
+            company_reports=company_reports,
         ),
     )
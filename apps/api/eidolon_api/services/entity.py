@@ -5,6 +5,7 @@ import re
 
 _TRAILING_VERSION_RE = re.compile(r"\s+\d+$")
 _NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_TRADEMARK_TABLE = str.maketrans("", "", "™®")
 
 # Common boilerplate tokens that show up in titles/snippets and create duplicate entities.
 _DROP_TOKENS = {
@@ -39,7 +40,7 @@ def entity_key_from_name(name: str) -> str:
     """
     cleaned = canonical_display_name(name).lower()
     # Drop common trademark glyphs and similar punctuation noise.
-    cleaned = cleaned.replace("™", "").replace("®", "")
+    cleaned = cleaned.translate(_TRADEMARK_TABLE)
     cleaned = _NON_ALNUM_RE.sub(" ", cleaned)
     tokens = [t for t in cleaned.split() if t and t not in _DROP_TOKENS]
     return " ".join(tokens)[:140].strip()
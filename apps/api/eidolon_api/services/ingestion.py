@@ -1,24 +1,46 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import hashlib
 import json
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Iterable
-from urllib.parse import urlparse
+from functools import lru_cache
+from itertools import repeat
+from typing import Awaitable, Callable, Iterable, TypeVar
 
 import httpx
-from sqlalchemy import delete, func
+import numpy as np
+import orjson
+from sqlalchemy import and_, delete, exists, func, insert, or_, select
 from sqlalchemy.orm import Session
 
 from .. import models
+from ..cache import TTLCache
 from .entity import entity_key_from_name
 from .providers.router import SourceRouter
 from .scoring import AOV_BY_CATEGORY
 
 WIKIDATA_SPARQL_URL = "https://query.wikidata.org/sparql"
 
+# Storefront probes (homepage metadata + Shopify catalog) are network-bound, so they run concurrently on one pool.
+SITE_FETCH_CONCURRENCY = 20
+_SITE_HEADERS = {"User-Agent": "BURCH-EIDOLON/1.0"}
+
+# Homepage validators + extracted metadata by site URL, so universe rebuilds revalidate with conditional GETs and
+# skip the HTML body on 304. Entries: (etag, last_modified, final_url, title, description).
+_SITE_METADATA_CACHE: TTLCache[tuple[str, str, str, str, str]] = TTLCache(maxsize=4096, ttl=7 * 24 * 3600)
+
+# Same idea for /products.json, keyed by catalog URL; the TTL spans the weekly refresh cadence.
+# Entries: (etag, last_modified, product_count, median_price).
+_CATALOG_CACHE: TTLCache[tuple[str, str, int, float | None]] = TTLCache(maxsize=4096, ttl=8 * 24 * 3600)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 UNIVERSE_QUERY_LANES: list[tuple[str, str]] = [
     # Bias towards small-to-mid ecommerce brands by targeting Shopify storefronts.
@@ -108,6 +130,20 @@ PUBLISHER_HOST_FRAGMENTS = (
     "foodandwine.com",
 )
 
+RESALE_HOST_FRAGMENTS = ("depop.com", "poshmark.com", "grailed.com", "ebay.", "stockx.com")
+JOB_HOST_FRAGMENTS = ("greenhouse.io", "lever.co", "workable.com", "ashbyhq.com", "linkedin.com")
+
+
+def _fragment_re(fragments: Iterable[str]) -> re.Pattern[str]:
+    # One alternation scans a host once instead of one substring search per fragment.
+    return re.compile("|".join(re.escape(fragment) for fragment in fragments))
+
+
+# Excluded and publisher hosts are always rejected together, so one alternation covers both lists.
+_REJECTED_HOST_RE = _fragment_re(EXCLUDED_HOST_FRAGMENTS + PUBLISHER_HOST_FRAGMENTS)
+_RESALE_HOST_RE = _fragment_re(RESALE_HOST_FRAGMENTS)
+_JOB_HOST_RE = _fragment_re(JOB_HOST_FRAGMENTS)
+
 MOMENTUM_TERMS = {
     "growth",
     "surge",
@@ -138,6 +174,22 @@ RISK_TERMS = {
     "warning",
 }
 
+_WS_RE = re.compile(r"\s+")
+_OFFICIAL_TAIL_RE = re.compile(r"\s+(official site|official store|shop online|store)\s*$", re.I)
+_LABEL_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+", re.I)
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_TITLE_TAG_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.I | re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+_META_DESCRIPTION_RE = re.compile(
+    r'<meta[^>]+name=[\"\']description[\"\'][^>]+content=[\"\']([^\"\']+)[\"\']',
+    re.I,
+)
+# Authority component as urlsplit finds it: optional scheme, then "//" up to the first path/query/fragment delimiter.
+_NETLOC_RE = re.compile(r"(?:[A-Za-z][A-Za-z0-9+.-]*:)?//([^/?#]*)")
+# urlsplit also drops leading C0 controls/spaces and every tab/CR/LF before parsing.
+_URL_LEADING_JUNK = "".join(chr(code) for code in range(0x21))
+_URL_UNSAFE_CHARS = str.maketrans("", "", "\t\r\n")
+
 
 def _deal_structure(heat: float, risk: float, asymmetry: float, capital: float) -> str:
     if asymmetry > 78 and risk < 55 and capital < 30:
@@ -157,11 +209,13 @@ def _monday_of_week(today: dt.date | None = None) -> dt.date:
 
 
 def _clean_text(value: str) -> str:
-    return re.sub(r"\s+", " ", value.strip())
+    return _WS_RE.sub(" ", value.strip())
 
 
+@lru_cache(maxsize=8192)
 def _host(url: str) -> str:
-    host = (urlparse(url).netloc or "").lower()
+    match = _NETLOC_RE.match(url.lstrip(_URL_LEADING_JUNK).translate(_URL_UNSAFE_CHARS))
+    host = match.group(1).lower() if match else ""
     if host.startswith("www."):
         host = host[4:]
     # Common ecommerce subdomains that should collapse into the canonical brand host.
@@ -171,16 +225,10 @@ def _host(url: str) -> str:
     return host
 
 
-def _is_excluded_host(host: str) -> bool:
-    lowered = host.lower()
-    if any(fragment in lowered for fragment in EXCLUDED_HOST_FRAGMENTS):
-        return True
-    return False
-
-
-def _is_publisher_host(host: str) -> bool:
-    lowered = host.lower()
-    return any(fragment in lowered for fragment in PUBLISHER_HOST_FRAGMENTS)
+@lru_cache(maxsize=4096)
+def _is_rejected_host(host: str) -> bool:
+    """Social/marketplace/tooling or publisher hosts that must never become brands."""
+    return _REJECTED_HOST_RE.search(host.lower()) is not None
 
 
 def _canonical_site_url(host: str) -> str:
@@ -201,7 +249,7 @@ def _name_from_title_tag(title: str) -> str:
     if not cleaned:
         return ""
     head = TITLE_SPLIT_RE.split(cleaned)[0].strip()
-    head = re.sub(r"\s+(official site|official store|shop online|store)\s*$", "", head, flags=re.I).strip()
+    head = _OFFICIAL_TAIL_RE.sub("", head).strip()
     return head[:80]
 
 
@@ -216,13 +264,13 @@ def _domain_label(host: str) -> str:
         label = core[-2]
     else:
         label = core[0]
-    label = re.sub(r"[^a-z0-9]+", " ", label, flags=re.I).strip()
+    label = _LABEL_NON_ALNUM_RE.sub(" ", label).strip()
     return label
 
 
 def _title_case_words(value: str) -> str:
-    words = [w for w in re.split(r"\s+", value.strip()) if w]
-    return " ".join(w[:1].upper() + w[1:] for w in words)
+    # Upper-cases only each word's first letter; str.title() would also re-case the tail ("shop4pets" -> "Shop4Pets").
+    return " ".join(w[:1].upper() + w[1:] for w in value.split())
 
 
 def _fallback_brand_name(host: str) -> str:
@@ -231,28 +279,38 @@ def _fallback_brand_name(host: str) -> str:
 
 def _extract_title_and_description(html: str) -> tuple[str, str]:
     # Keep parsing lightweight: regex is sufficient for a title + meta description best-effort.
-    title_match = re.search(r"<title[^>]*>(.*?)</title>", html, flags=re.I | re.S)
-    title = _clean_text(re.sub(r"<[^>]+>", "", title_match.group(1))) if title_match else ""
-    desc_match = re.search(
-        r'<meta[^>]+name=[\"\']description[\"\'][^>]+content=[\"\']([^\"\']+)[\"\']',
-        html,
-        flags=re.I,
-    )
+    title_match = _TITLE_TAG_RE.search(html)
+    title = _clean_text(_TAG_RE.sub("", title_match.group(1))) if title_match else ""
+    desc_match = _META_DESCRIPTION_RE.search(html)
     desc = _clean_text(desc_match.group(1)) if desc_match else ""
     return title, desc
 
 
-def _fetch_site_metadata(site_url: str) -> tuple[str, str, str]:
+async def _fetch_site_metadata(client: httpx.AsyncClient, site_url: str) -> tuple[str, str, str]:
+    cached = _SITE_METADATA_CACHE.get(site_url)
+    headers: dict[str, str] = {}
+    if cached:
+        etag, last_modified = cached[0], cached[1]
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
     try:
-        with httpx.Client(timeout=7.0, follow_redirects=True, headers={"User-Agent": "BURCH-EIDOLON/1.0"}) as client:
-            res = client.get(site_url)
-            res.raise_for_status()
-            html = res.text
+        res = await client.get(site_url, timeout=7.0, headers=headers)
+        if cached and res.status_code == 304:
+            return cached[2], cached[3], cached[4]
+        res.raise_for_status()
+        html = res.text
     except Exception:
         return site_url, "", ""
 
     title, desc = _extract_title_and_description(html)
-    return str(res.url), title, desc
+    final_url = str(res.url)
+    etag = res.headers.get("etag", "")
+    last_modified = res.headers.get("last-modified", "")
+    if etag or last_modified:
+        _SITE_METADATA_CACHE.set(site_url, (etag, last_modified, final_url, title, desc))
+    return final_url, title, desc
 
 
 def _looks_like_publisher(title: str, desc: str) -> bool:
@@ -281,19 +339,42 @@ def _looks_like_publisher(title: str, desc: str) -> bool:
     return False
 
 
-def _try_shopify_products(site_url: str) -> tuple[int | None, float | None]:
+async def _try_shopify_products(client: httpx.AsyncClient, site_url: str) -> tuple[int | None, float | None]:
     # Best-effort: Shopify commonly exposes /products.json
     base = site_url.rstrip("/")
     url = f"{base}/products.json?limit=250&page=1"
+    cached = _CATALOG_CACHE.get(url)
+    headers: dict[str, str] = {}
+    if cached:
+        etag, last_modified = cached[0], cached[1]
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
     try:
-        with httpx.Client(timeout=10.0, follow_redirects=True, headers={"User-Agent": "BURCH-EIDOLON/1.0"}) as client:
-            res = client.get(url)
-            if res.status_code != 200:
-                return None, None
-            payload = res.json()
-    except Exception:
+        res = await client.get(url, timeout=10.0, headers=headers)
+        if cached and res.status_code == 304:
+            return cached[2], cached[3]
+        if res.status_code != 200:
+            return None, None
+        # Catalog pages run to several MB; orjson parses the raw bytes without httpx's stdlib json decode.
+        payload = orjson.loads(res.content)
+    except (httpx.HTTPError, httpx.InvalidURL, ValueError):
+        # ValueError also covers orjson.JSONDecodeError and malformed site URLs rejected while building the request.
         return None, None
 
+    sku_count, median_price = _catalog_summary(payload)
+    etag = res.headers.get("etag", "")
+    last_modified = res.headers.get("last-modified", "")
+    if etag or last_modified:
+        _CATALOG_CACHE.set(url, (etag, last_modified, sku_count, median_price))
+    else:
+        # The site stopped sending validators; drop the old ones rather than revalidating against them.
+        _CATALOG_CACHE.discard(url)
+    return sku_count, median_price
+
+
+def _catalog_summary(payload: dict) -> tuple[int, float | None]:
     products = payload.get("products")
     if not isinstance(products, list) or not products:
         return 0, None
@@ -314,18 +395,72 @@ def _try_shopify_products(site_url: str) -> tuple[int | None, float | None]:
             if price > 0:
                 prices.append(price)
 
-    prices.sort()
-    median_price = prices[len(prices) // 2] if prices else None
+    # Selection, not a full sort: element len//2 of the ordered prices (the upper median), as before.
+    mid = len(prices) // 2
+    median_price = float(np.partition(np.asarray(prices, dtype=np.float64), mid)[mid]) if prices else None
     return len(products), median_price
 
 
-def _count_term_hits(text: str, terms: set[str]) -> int:
-    lowered = text.lower()
-    hits = 0
-    for term in terms:
+async def _gather_site_fetches(
+    fetch: Callable[[httpx.AsyncClient, T], Awaitable[R]],
+    items: Iterable[T],
+) -> list[R]:
+    limiter = asyncio.Semaphore(SITE_FETCH_CONCURRENCY)
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=30)
+    async with httpx.AsyncClient(follow_redirects=True, headers=_SITE_HEADERS, limits=limits, http2=True) as client:
+
+        async def run(item: T) -> R:
+            async with limiter:
+                return await fetch(client, item)
+
+        return await asyncio.gather(*(run(item) for item in items))
+
+
+def _fetch_all(fetch: Callable[[httpx.AsyncClient, T], Awaitable[R]], items: Iterable[T]) -> list[R]:
+    """Run `fetch` for every item on a shared client, bounded by SITE_FETCH_CONCURRENCY; results keep input order."""
+    return asyncio.run(_gather_site_fetches(fetch, items))
+
+
+async def _probe_storefront(
+    client: httpx.AsyncClient,
+    item: tuple[CandidateAggregate, bool],
+) -> tuple[str, str, str] | None:
+    """Return (final_url, title, description) for candidates that look like a live Shopify brand storefront."""
+    agg, fetch_metadata = item
+    site_url = _canonical_site_url(agg.host)
+    final_url = site_url
+    title = ""
+    desc = ""
+    if fetch_metadata:
+        final_url, title, desc = await _fetch_site_metadata(client, site_url)
+    seed_context = " ".join(
+        f"{row.get('title', '')} {row.get('snippet', '')}" for row in agg.seed_evidence[:3] if isinstance(row, dict)
+    )
+    if _looks_like_publisher(title, desc or seed_context):
+        return None
+
+    # Gate on "brand-like" ecommerce behavior. This keeps the PoC from filling with publishers/services.
+    seed_sku_count, _ = await _try_shopify_products(client, final_url)
+    if seed_sku_count is None or seed_sku_count < 1:
+        return None
+    return final_url, title, desc
+
+
+def _term_hits(text: str) -> tuple[int, int]:
+    """Count distinct momentum and risk terms appearing in `text`, lowercasing it once for both sets."""
+    return _lowered_term_hits(text.lower())
+
+
+def _lowered_term_hits(lowered: str) -> tuple[int, int]:
+    momentum = 0
+    for term in MOMENTUM_TERMS:
         if term in lowered:
-            hits += 1
-    return hits
+            momentum += 1
+    risk = 0
+    for term in RISK_TERMS:
+        if term in lowered:
+            risk += 1
+    return momentum, risk
 
 
 def _clamp(value: float, low: float, high: float) -> float:
@@ -371,14 +506,13 @@ class CandidateAggregate:
 def _collect_universe_candidates(router: SourceRouter) -> dict[str, CandidateAggregate]:
     candidates: dict[str, CandidateAggregate] = {}
 
-    for query, category in UNIVERSE_QUERY_LANES:
-        provider, results = router.search(query=query, limit=25)
-        _ = provider
+    lane_results = router.search_many([query for query, _ in UNIVERSE_QUERY_LANES], limit=25)
+    for (_, category), (_, results) in zip(UNIVERSE_QUERY_LANES, lane_results):
         for r in results:
             host = _host(r.url)
             if not host:
                 continue
-            if _is_excluded_host(host) or _is_publisher_host(host):
+            if _is_rejected_host(host):
                 continue
 
             agg = candidates.get(host)
@@ -390,9 +524,9 @@ def _collect_universe_candidates(router: SourceRouter) -> dict[str, CandidateAgg
             agg.bump_category(category)
             agg.engines.add((r.source or "searxng").lower())
             agg.visibility += float(r.score or 1.0)
-            text = f"{r.title} {r.snippet}"
-            agg.momentum_hits += _count_term_hits(text, MOMENTUM_TERMS)
-            agg.risk_hits += _count_term_hits(text, RISK_TERMS)
+            momentum_hits, risk_hits = _term_hits(f"{r.title} {r.snippet}")
+            agg.momentum_hits += momentum_hits
+            agg.risk_hits += risk_hits
             if len(agg.seed_evidence) < 6:
                 agg.seed_evidence.append(
                     {
@@ -407,18 +541,16 @@ def _collect_universe_candidates(router: SourceRouter) -> dict[str, CandidateAgg
 
 
 def _rank_candidates(candidates: Iterable[CandidateAggregate]) -> list[CandidateAggregate]:
-    ranked: list[tuple[float, CandidateAggregate]] = []
-    for agg in candidates:
-        appearances = float(agg.appearances)
-        engines = float(len(agg.engines))
-        momentum = float(agg.momentum_hits)
-        visibility = float(agg.visibility)
-        risk = float(agg.risk_hits)
-        # Composite prioritizes acceleration keywords + repeated appearance across lanes.
-        score = appearances * 6.0 + engines * 4.0 + momentum * 5.0 + visibility * 0.6 - risk * 8.0
-        ranked.append((score, agg))
-    ranked.sort(key=lambda item: item[0], reverse=True)
-    return [agg for _, agg in ranked]
+    aggs = list(candidates)
+    features = np.array(
+        [(agg.appearances, len(agg.engines), agg.momentum_hits, agg.visibility, agg.risk_hits) for agg in aggs],
+        dtype=np.float64,
+    ).reshape(-1, 5)
+    appearances, engines, momentum, visibility, risk = features.T
+    # Composite prioritizes acceleration keywords + repeated appearance across lanes.
+    scores = appearances * 6.0 + engines * 4.0 + momentum * 5.0 + visibility * 0.6 - risk * 8.0
+    # Stable descending order, so tied candidates keep their discovery order.
+    return [aggs[i] for i in np.argsort(-scores, kind="stable")]
 
 
 def _wikidata_seed_brands(limit: int) -> list[dict[str, str]]:
@@ -511,7 +643,33 @@ def _category_from_industry(industry: str) -> str:
     return "Unknown"
 
 
-def _signal_counts_from_results(results: list[dict[str, str]], brand_host: str) -> dict[str, int]:
+# Host substring -> platform kind counted by _scan_results.
+_PLATFORM_HOST_KINDS = (
+    ("instagram.com", "instagram"),
+    ("tiktok.com", "tiktok"),
+    ("reddit.com", "reddit"),
+    ("pinterest.com", "pinterest"),
+    ("substack.com", "substack"),
+    ("medium.com", "medium"),
+    ("youtube.com", "youtube"),
+    ("youtu.be", "youtube"),
+    ("facebook.com", "facebook"),
+)
+
+
+@lru_cache(maxsize=4096)
+def _host_kinds(host: str) -> frozenset[str]:
+    """Classify a result host once; evidence rows repeat a small set of platform hosts."""
+    kinds = {kind for fragment, kind in _PLATFORM_HOST_KINDS if fragment in host}
+    if _JOB_HOST_RE.search(host):
+        kinds.add("job_board")
+    if _RESALE_HOST_RE.search(host):
+        kinds.add("resale_host")
+    return frozenset(kinds)
+
+
+def _scan_results(results: list[dict[str, str]], brand_host: str) -> tuple[dict[str, int], str]:
+    """Signal counts plus the lowercased title/snippet text of every row, gathered in one pass."""
     counts = {
         "brand_site": 0,
         "instagram": 0,
@@ -527,46 +685,109 @@ def _signal_counts_from_results(results: list[dict[str, str]], brand_host: str)
         "resale": 0,
     }
 
-    resale_hosts = ("depop.com", "poshmark.com", "grailed.com", "ebay.", "stockx.com")
-    job_hosts = ("greenhouse.io", "lever.co", "workable.com", "ashbyhq.com")
-
+    texts: list[str] = []
+    brand_suffix = f".{brand_host}"
     for row in results:
         url = row.get("url", "")
         host = _host(url)
+        kinds = _host_kinds(host)
         title = (row.get("title", "") or "").lower()
         snippet = (row.get("snippet", "") or "").lower()
         text = f"{title} {snippet}"
+        texts.append(text)
 
-        if host == brand_host or host.endswith(f".{brand_host}"):
+        if host == brand_host or host.endswith(brand_suffix):
             counts["brand_site"] += 1
-        if "instagram.com" in host:
-            counts["instagram"] += 1
-        if "tiktok.com" in host:
-            counts["tiktok"] += 1
-        if "reddit.com" in host:
-            counts["reddit"] += 1
-        if "pinterest.com" in host:
-            counts["pinterest"] += 1
-        if "substack.com" in host:
-            counts["substack"] += 1
-        if "medium.com" in host:
-            counts["medium"] += 1
-        if "youtube.com" in host or "youtu.be" in host:
-            counts["youtube"] += 1
-        if "facebook.com" in host and "ads/library" in url:
+        for kind in kinds:
+            # Platform kinds share their names with the count buckets.
+            if kind in counts:
+                counts[kind] += 1
+        if "facebook" in kinds and "ads/library" in url:
             counts["meta_ads"] += 1
-        if any(h in host for h in job_hosts) or "linkedin.com" in host:
+        if "job_board" in kinds:
             if "job" in text or "careers" in text or "hiring" in text:
                 counts["jobs"] += 1
-        if "stockist" in text or "stockists" in text or "where to buy" in text:
+        if "stockist" in text or "where to buy" in text:
             counts["stockists"] += 1
-        if any(h in host for h in resale_hosts) or "resale" in text:
+        if "resale_host" in kinds or "resale" in text:
             counts["resale"] += 1
 
-    return counts
+    return counts, " ".join(texts)
+
+
+# Capital intensity: category prior, adjusted for SKU complexity in the metrics kernel.
+_CAPITAL_BY_CATEGORY: dict[str, float] = {
+    "Food & Beverage": 70.0,
+    "Home Goods": 65.0,
+    "Outdoor": 60.0,
+    "Apparel": 60.0,
+    "Pet": 60.0,
+    "Beauty": 55.0,
+    "Personal Care": 55.0,
+    "Childcare": 55.0,
+    "Wellness": 50.0,
+    "Consumer Tech": 45.0,
+}
+
+_SNAPSHOT_METRIC_KEYS = (
+    "instagram_follower_velocity",
+    "tiktok_follower_velocity",
+    "engagement_rate",
+    "comments_to_likes_ratio",
+    "repeat_commenter_density",
+    "influencer_tag_overlap",
+    "ugc_repost_frequency",
+    "engagement_quality",
+    "website_traffic_k",
+    "sku_count",
+    "sellout_velocity",
+    "meta_ad_activity",
+    "hiring_velocity",
+    "stockist_expansion",
+    "google_trends_velocity",
+    "reddit_mentions",
+    "pinterest_saves_velocity",
+    "blog_mentions",
+    "resale_activity",
+    "heat_score",
+    "risk_score",
+    "asymmetry_index",
+    "capital_intensity",
+    "revenue_p10",
+    "revenue_p50",
+    "revenue_p90",
+    "capital_required_musd",
+    "momentum_hits",
+    "risk_hits",
+)
+
+
+# Metrics written to the daily time series; "heat" stores heat_score.
+_TIMESERIES_METRICS = (
+    "heat",
+    "instagram_follower_velocity",
+    "tiktok_follower_velocity",
+    "engagement_rate",
+    "comments_to_likes_ratio",
+    "repeat_commenter_density",
+    "influencer_tag_overlap",
+    "ugc_repost_frequency",
+    "engagement_quality",
+    "website_traffic_k",
+    "sku_count",
+    "sellout_velocity",
+    "meta_ad_activity",
+    "hiring_velocity",
+    "stockist_expansion",
+    "google_trends_velocity",
+    "reddit_mentions",
+    "pinterest_saves_velocity",
+    "blog_mentions",
+    "resale_activity",
+)
 
 
-def _compute_snapshot_metrics(
+def _snapshot_inputs(
     *,
     category: str,
     evidence_results: list[dict[str, str]],
@@ -574,78 +795,97 @@ def _compute_snapshot_metrics(
     brand_host: str,
     sku_count: int | None,
     median_price_usd: float | None,
-) -> dict[str, float]:
+) -> tuple[float, ...]:
     # Signals come only from retrieved evidence (no randomness).
-    term_blob = " ".join(f"{r.get('title','')} {r.get('snippet','')}" for r in evidence_results)
-    momentum_hits = float(_count_term_hits(term_blob, MOMENTUM_TERMS))
-    risk_hits = float(_count_term_hits(term_blob, RISK_TERMS))
-
-    signals = _signal_counts_from_results(evidence_results, brand_host=brand_host)
-    traffic_signals = _signal_counts_from_results(traffic_results, brand_host=brand_host)
-
-    instagram = signals["instagram"]
-    tiktok = signals["tiktok"]
-    reddit = signals["reddit"]
-    pinterest = signals["pinterest"]
-    blogs = signals["substack"] + signals["medium"]
-    resale = signals["resale"]
+    signals, term_text = _scan_results(evidence_results, brand_host=brand_host)
+    momentum_hits, risk_hits = _lowered_term_hits(term_text)
+    traffic_signals, _ = _scan_results(traffic_results, brand_host=brand_host)
 
     indexed_pages = max(1, traffic_signals["brand_site"])
-    traffic_k = _clamp(8 + indexed_pages * 10 + momentum_hits * 4 + (instagram + tiktok) * 6, 5, 450)
-
     sku_proxy = float(sku_count) if sku_count is not None else _clamp(indexed_pages * 6, 10, 600)
-    sku_proxy = _clamp(sku_proxy, 1, 2000)
-
-    engagement_quality = _clamp(0.62 + (instagram + tiktok) / 40 - risk_hits / 18, 0.2, 0.98)
-    engagement_rate = _clamp(1.0 + (instagram + tiktok) * 0.8 + momentum_hits * 0.6, 0.5, 18.0)
-    comments_to_likes = _clamp(0.04 + engagement_quality * 0.11, 0.02, 0.32)
-    repeat_density = _clamp(0.12 + engagement_quality * 0.55 - risk_hits * 0.01, 0.08, 0.95)
-    influencer_overlap = _clamp(22 + (instagram + tiktok) * 4 + momentum_hits * 3, 5, 99)
-    ugc_reposts = _clamp(6 + (instagram + tiktok) * 3 + pinterest * 1.5, 1, 95)
-
-    meta_ads = _clamp(10 + signals["meta_ads"] * 18 + momentum_hits * 2, 0, 99)
-    hiring = _clamp(signals["jobs"] * 8 + momentum_hits * 2, 0, 55)
-    stockists = _clamp(signals["stockists"] * 8 + momentum_hits * 1.2, 0, 45)
-    sellout = _clamp(35 + momentum_hits * 4 + (instagram + tiktok) * 2 - risk_hits * 3, 5, 99)
-
-    google_trends = _clamp(18 + (instagram + tiktok) * 4 + momentum_hits * 6 - risk_hits * 3, 2, 100)
-    reddit_mentions = _clamp(reddit * 12 + momentum_hits * 3, 0, 120)
-    pinterest_saves = _clamp(pinterest * 10 + momentum_hits * 2, 0, 100)
-    blog_mentions = _clamp(blogs * 8 + momentum_hits * 1.5, 0, 40)
-    resale_activity = _clamp(resale * 12 + momentum_hits * 1.2, 0, 100)
-
     # AOV: if we can observe a median item price, use it directionally; otherwise category default.
     aov = float(median_price_usd) if median_price_usd else float(AOV_BY_CATEGORY.get(category, 60.0))
-    aov = _clamp(aov * 1.15, 10, 400)
+
+    return (
+        signals["instagram"],
+        signals["tiktok"],
+        signals["reddit"],
+        signals["pinterest"],
+        signals["substack"] + signals["medium"],
+        signals["resale"],
+        signals["meta_ads"],
+        signals["jobs"],
+        signals["stockists"],
+        momentum_hits,
+        risk_hits,
+        indexed_pages,
+        sku_proxy,
+        aov,
+        _CAPITAL_BY_CATEGORY.get(category, 55.0),
+    )
+
+
+def _compute_snapshot_metrics(inputs: list[tuple[float, ...]]) -> list[dict[str, float]]:
+    # One column per input from `_snapshot_inputs`; every brand is scored in the same vectorized pass.
+    if not inputs:
+        return []
+    (
+        instagram,
+        tiktok,
+        reddit,
+        pinterest,
+        blogs,
+        resale,
+        meta_ad_hits,
+        job_hits,
+        stockist_hits,
+        momentum_hits,
+        risk_hits,
+        indexed_pages,
+        sku_proxy,
+        aov,
+        base_capital,
+    ) = np.array(inputs, dtype=np.float64).T
+    social = instagram + tiktok
+
+    traffic_k = np.clip(8 + indexed_pages * 10 + momentum_hits * 4 + social * 6, 5, 450)
+    sku_proxy = np.clip(sku_proxy, 1, 2000)
+
+    engagement_quality = np.clip(0.62 + social / 40 - risk_hits / 18, 0.2, 0.98)
+    engagement_rate = np.clip(1.0 + social * 0.8 + momentum_hits * 0.6, 0.5, 18.0)
+    comments_to_likes = np.clip(0.04 + engagement_quality * 0.11, 0.02, 0.32)
+    repeat_density = np.clip(0.12 + engagement_quality * 0.55 - risk_hits * 0.01, 0.08, 0.95)
+    influencer_overlap = np.clip(22 + social * 4 + momentum_hits * 3, 5, 99)
+    ugc_reposts = np.clip(6 + social * 3 + pinterest * 1.5, 1, 95)
+
+    meta_ads = np.clip(10 + meta_ad_hits * 18 + momentum_hits * 2, 0, 99)
+    hiring = np.clip(job_hits * 8 + momentum_hits * 2, 0, 55)
+    stockists = np.clip(stockist_hits * 8 + momentum_hits * 1.2, 0, 45)
+    sellout = np.clip(35 + momentum_hits * 4 + social * 2 - risk_hits * 3, 5, 99)
+
+    google_trends = np.clip(18 + social * 4 + momentum_hits * 6 - risk_hits * 3, 2, 100)
+    reddit_mentions = np.clip(reddit * 12 + momentum_hits * 3, 0, 120)
+    pinterest_saves = np.clip(pinterest * 10 + momentum_hits * 2, 0, 100)
+    blog_mentions = np.clip(blogs * 8 + momentum_hits * 1.5, 0, 40)
+    resale_activity = np.clip(resale * 12 + momentum_hits * 1.2, 0, 100)
+
+    aov = np.clip(aov * 1.15, 10, 400)
 
     # Revenue (annual, $M) from proxy traffic + conversion + AOV.
-    conversion_pct = _clamp(0.9 + (instagram + tiktok) / 50 + engagement_quality * 0.9 - risk_hits / 22, 0.7, 5.5)
+    conversion_pct = np.clip(0.9 + social / 50 + engagement_quality * 0.9 - risk_hits / 22, 0.7, 5.5)
     monthly_rev = (traffic_k * 1000) * (conversion_pct / 100.0) * aov
-    annual_rev_musd = _clamp(monthly_rev * 12 / 1_000_000, 0.4, 350.0)
-    rev_p10 = _clamp(annual_rev_musd * 0.72, 0.2, 350.0)
-    rev_p90 = _clamp(annual_rev_musd * 1.32, 0.3, 600.0)
-
-    # Capital intensity: category prior with small adjustment for SKU complexity.
-    base_capital = {
-        "Food & Beverage": 70.0,
-        "Home Goods": 65.0,
-        "Outdoor": 60.0,
-        "Apparel": 60.0,
-        "Pet": 60.0,
-        "Beauty": 55.0,
-        "Personal Care": 55.0,
-        "Childcare": 55.0,
-        "Wellness": 50.0,
-        "Consumer Tech": 45.0,
-    }.get(category, 55.0)
-    capital_intensity = _clamp(base_capital + (sku_proxy / 120) * 6 - engagement_quality * 8, 10, 95)
+    annual_rev_musd = np.clip(monthly_rev * 12 / 1_000_000, 0.4, 350.0)
+    rev_p10 = np.clip(annual_rev_musd * 0.72, 0.2, 350.0)
+    rev_p90 = np.clip(annual_rev_musd * 1.32, 0.3, 600.0)
+
+    capital_intensity = np.clip(base_capital + (sku_proxy / 120) * 6 - engagement_quality * 8, 10, 95)
 
     # Heat and risk scores (0-100) aligned to PDF, but computed strictly from retrieved signals.
-    growth_velocity = _clamp((instagram + tiktok) * 10 + momentum_hits * 3, 0, 100)
-    sentiment_score = _clamp(55 + momentum_hits * 5 - risk_hits * 8, 0, 100)
-    geographic_spread = _clamp(45 + blogs * 6 + reddit * 4, 0, 100)
+    growth_velocity = np.clip(social * 10 + momentum_hits * 3, 0, 100)
+    sentiment_score = np.clip(55 + momentum_hits * 5 - risk_hits * 8, 0, 100)
+    geographic_spread = np.clip(45 + blogs * 6 + reddit * 4, 0, 100)
 
-    heat_score = _clamp(
+    heat_score = np.clip(
         0.30 * growth_velocity
         + 0.20 * (engagement_quality * 100)
         + 0.15 * ugc_reposts
@@ -655,42 +895,120 @@ def _compute_snapshot_metrics(
         5,
         99.9,
     )
-    risk_score = _clamp(18 + risk_hits * 18 + (1 - engagement_quality) * 38, 5, 98)
-    asymmetry = _clamp(heat_score * 0.72 + (100 - risk_score) * 0.28 - capital_intensity * 0.10 + 8, 5, 98)
+    risk_score = np.clip(18 + risk_hits * 18 + (1 - engagement_quality) * 38, 5, 98)
+    asymmetry = np.clip(heat_score * 0.72 + (100 - risk_score) * 0.28 - capital_intensity * 0.10 + 8, 5, 98)
+
+    capital_required = np.clip(2.0 + annual_rev_musd * (0.06 + capital_intensity / 800), 1.0, 120.0)
+
+    columns = np.column_stack(
+        (
+            np.clip(instagram * 10.0, 0.0, 100.0),
+            np.clip(tiktok * 10.0, 0.0, 100.0),
+            engagement_rate,
+            comments_to_likes,
+            repeat_density,
+            influencer_overlap,
+            ugc_reposts,
+            engagement_quality,
+            traffic_k,
+            sku_proxy,
+            sellout,
+            meta_ads,
+            hiring,
+            stockists,
+            google_trends,
+            reddit_mentions,
+            pinterest_saves,
+            blog_mentions,
+            resale_activity,
+            heat_score,
+            risk_score,
+            asymmetry,
+            capital_intensity,
+            rev_p10,
+            annual_rev_musd,
+            rev_p90,
+            capital_required,
+            momentum_hits,
+            risk_hits,
+        )
+    )
+    return [dict(zip(_SNAPSHOT_METRIC_KEYS, row)) for row in columns.tolist()]
 
-    capital_required = _clamp(2.0 + annual_rev_musd * (0.06 + capital_intensity / 800), 1.0, 120.0)
 
-    return {
-        "instagram_follower_velocity": float(_clamp(instagram * 10.0, 0.0, 100.0)),
-        "tiktok_follower_velocity": float(_clamp(tiktok * 10.0, 0.0, 100.0)),
-        "engagement_rate": float(engagement_rate),
-        "comments_to_likes_ratio": float(comments_to_likes),
-        "repeat_commenter_density": float(repeat_density),
-        "influencer_tag_overlap": float(influencer_overlap),
-        "ugc_repost_frequency": float(ugc_reposts),
-        "engagement_quality": float(engagement_quality),
-        "website_traffic_k": float(traffic_k),
-        "sku_count": float(_clamp(sku_proxy, 1, 2000)),
-        "sellout_velocity": float(sellout),
-        "meta_ad_activity": float(meta_ads),
-        "hiring_velocity": float(hiring),
-        "stockist_expansion": float(stockists),
-        "google_trends_velocity": float(google_trends),
-        "reddit_mentions": float(reddit_mentions),
-        "pinterest_saves_velocity": float(pinterest_saves),
-        "blog_mentions": float(blog_mentions),
-        "resale_activity": float(resale_activity),
-        "heat_score": float(heat_score),
-        "risk_score": float(risk_score),
-        "asymmetry_index": float(asymmetry),
-        "capital_intensity": float(capital_intensity),
-        "revenue_p10": float(rev_p10),
-        "revenue_p50": float(annual_rev_musd),
-        "revenue_p90": float(rev_p90),
-        "capital_required_musd": float(capital_required),
-        "momentum_hits": float(momentum_hits),
-        "risk_hits": float(risk_hits),
-    }
+def _gather_brand_evidence(
+    router: SourceRouter, brand_name: str, brand_host: str, enrich: bool
+) -> tuple[list[dict[str, str]], list[dict[str, str]], list[dict[str, str]]]:
+    # Retrieval: brand context + site depth (both real web). Runs on worker threads, so it takes plain values only.
+    name_tokens = [t for t in _NON_ALNUM_RE.split((brand_name or "").lower()) if len(t) >= 3]
+    name_tokens = [t for t in name_tokens if t not in {"the", "and", "for", "with", "official", "shop", "store"}]
+    required_tokens = min(2, len(name_tokens)) if name_tokens else 0
+
+    def _matches_brand(text: str) -> bool:
+        if required_tokens == 0:
+            return True
+        lowered = (text or "").lower()
+        hits = sum(1 for tok in name_tokens if tok in lowered)
+        return hits >= required_tokens
+
+    baseline_queries = [
+        f"site:{brand_host}",
+        f"\"{brand_name}\" \"{brand_host}\"",
+        f"\"{brand_host}\"",
+    ]
+
+    evidence_rows: list[dict[str, str]] = []
+    traffic_rows: list[dict[str, str]] = []
+    seen_urls: set[str] = set()
+
+    for q in baseline_queries:
+        _, results = router.search(query=q, limit=20)
+        for r in results:
+            if not r.url or r.url in seen_urls:
+                continue
+            url_host = _host(r.url)
+            # For baseline signals, only trust URLs that corroborate the brand's own host.
+            if url_host != brand_host and not url_host.endswith(f".{brand_host}"):
+                continue
+            seen_urls.add(r.url)
+            row = {"title": r.title, "url": r.url, "snippet": r.snippet, "source": r.source}
+            if q.startswith("site:"):
+                traffic_rows.append(row)
+            else:
+                evidence_rows.append(row)
+
+    extra_evidence_rows: list[dict[str, str]] = []
+    if enrich:
+        enrich_queries = [
+            f"\"{brand_name}\" instagram",
+            f"\"{brand_name}\" tiktok",
+            f"\"{brand_name}\" reddit",
+            f"\"{brand_name}\" meta ad library",
+        ]
+        # Pull in additional evidence specifically relevant to production/cost-down angles.
+        production_queries = [
+            f"\"{brand_name}\" manufacturing sourcing supplier co-packer 3pl fulfillment packaging",
+            f"site:{brand_host} \"made in\" manufacturing sourcing packaging fulfillment",
+        ]
+        enrich_results = [router.search(query=q, limit=10) for q in enrich_queries + production_queries]
+
+        for _, results in enrich_results[: len(enrich_queries)]:
+            for r in results:
+                if not r.url or r.url in seen_urls:
+                    continue
+                if not _matches_brand(f"{r.url} {r.title} {r.snippet}"):
+                    continue
+                seen_urls.add(r.url)
+                evidence_rows.append({"title": r.title, "url": r.url, "snippet": r.snippet, "source": r.source})
+
+        extra_evidence_rows = [
+            {"title": r.title, "url": r.url, "snippet": r.snippet, "source": r.source}
+            for _, results in enrich_results[len(enrich_queries) :]
+            for r in results
+            if r.url
+        ]
+
+    return evidence_rows, traffic_rows, extra_evidence_rows
 
 
 def reset_all_data(db: Session) -> None:
@@ -707,24 +1025,22 @@ def _legacy_synthetic_present(db: Session) -> bool:
     Detect legacy synthetic datasets from early PoC iterations.
     If present, we wipe the DB so the universe is rebuilt from real retrieval.
     """
-    brand_total = int(db.query(func.count(models.Brand.id)).scalar() or 0)
-    brand_ids = [row[0] for row in db.query(models.Brand.id).limit(5000).all()]
-    for bid in brand_ids:
-        # Legacy seed used "brand-001" style identifiers.
-        if re.fullmatch(r"brand-\d{3}", bid or ""):
-            return True
+    # Legacy seed used "brand-001" style identifiers; real ids carry a 12-char digest, so the LIKE is unambiguous.
+    if db.query(exists().where(models.Brand.id.like("brand-___"))).scalar():
+        return True
 
     bad_url_fragments = ("search.local", "registry.example", "news.example")
-    evidence_urls = [row[0] for row in db.query(models.EvidenceCitation.url).limit(5000).all()]
-    for url in evidence_urls:
-        if url and any(fragment in url for fragment in bad_url_fragments):
-            return True
+    bad_url = or_(*(models.EvidenceCitation.url.contains(fragment) for fragment in bad_url_fragments))
+    if db.query(exists().where(bad_url)).scalar():
+        return True
 
     # Heuristic: synthetic datasets often have very low evidence coverage (or no brand-site corroboration).
-    if brand_total >= 20:
-        evidence_brand_count = int(db.query(func.count(func.distinct(models.EvidenceCitation.brand_id))).scalar() or 0)
-        if evidence_brand_count < int(brand_total * 0.35):
-            return True
+    brand_total, evidence_brand_count = db.query(
+        func.count(models.Brand.id),
+        select(func.count(func.distinct(models.EvidenceCitation.brand_id))).scalar_subquery(),
+    ).one()
+    if brand_total >= 20 and evidence_brand_count < int(brand_total * 0.35):
+        return True
     return False
 
 
@@ -766,7 +1082,7 @@ def refresh_universe_snapshot(
                     continue
                 if host in seen_hosts:
                     continue
-                if _is_excluded_host(host) or _is_publisher_host(host):
+                if _is_rejected_host(host):
                     continue
 
                 inception = row.get("inception") or ""
@@ -822,24 +1138,17 @@ def refresh_universe_snapshot(
             # Standard universe build via metasearch candidates.
             metadata_fetch_limit = max(30, enrich_top_n)
 
-            for idx, agg in enumerate(ranked):
-                site_url = _canonical_site_url(agg.host)
-                final_url = site_url
-                title = ""
-                desc = ""
-                if idx < metadata_fetch_limit:
-                    final_url, title, desc = _fetch_site_metadata(site_url)
-                final_host = _host(final_url) or agg.host
-                seed_context = " ".join(
-                    f"{row.get('title', '')} {row.get('snippet', '')}" for row in agg.seed_evidence[:3] if isinstance(row, dict)
-                )
-                if _looks_like_publisher(title, desc or seed_context):
-                    continue
-
-                # Gate on "brand-like" ecommerce behavior. This keeps the PoC from filling with publishers/services.
-                seed_sku_count, _ = _try_shopify_products(final_url)
-                if seed_sku_count is None or seed_sku_count < 1:
+            probes = _fetch_all(_probe_storefront, [(agg, idx < metadata_fetch_limit) for idx, agg in enumerate(ranked)])
+            # The universe is (nearly) empty on this path, so one read covers every brand's existing evidence URLs.
+            seed_seen: defaultdict[str, set[str]] = defaultdict(set)
+            for seen_brand_id, seen_url in db.query(models.EvidenceCitation.brand_id, models.EvidenceCitation.url):
+                seed_seen[seen_brand_id].add(seen_url)
+            seed_rows: list[dict[str, str | float]] = []
+            for agg, probe in zip(ranked, probes):
+                if probe is None:
                     continue
+                final_url, title, desc = probe
+                final_host = _host(final_url) or agg.host
 
                 name = _name_from_title_tag(title) or _fallback_brand_name(final_host)
                 entity_key = entity_key_from_name(name) or _domain_label(final_host)
@@ -872,9 +1181,7 @@ def refresh_universe_snapshot(
                         brand.website = final_url
                     elif existing_host == candidate_host:
                         brand.website = final_url
-                    elif (_is_excluded_host(existing_host) or _is_publisher_host(existing_host)) and not (
-                        _is_excluded_host(candidate_host) or _is_publisher_host(candidate_host)
-                    ):
+                    elif _is_rejected_host(existing_host) and not _is_rejected_host(candidate_host):
                         brand.website = final_url
 
                     # Description: keep the richer text.
@@ -898,25 +1205,26 @@ def refresh_universe_snapshot(
                     created += 1
 
                 # Seed minimal evidence from the universe lane results (real URLs).
-                seed_seen = {
-                    row[0]
-                    for row in db.query(models.EvidenceCitation.url).filter(models.EvidenceCitation.brand_id == brand_id).all()
-                }
+                brand_seen = seed_seen[brand_id]
                 for row in agg.seed_evidence[:3]:
-                    if row["url"] in seed_seen:
+                    if row["url"] in brand_seen:
                         continue
-                    seed_seen.add(row["url"])
-                    db.add(
-                        models.EvidenceCitation(
-                            brand_id=brand_id,
-                            title=row["title"],
-                            url=row["url"],
-                            snippet=row["snippet"],
-                            source=row["source"] or "searxng",
-                            reliability=round(_source_reliability(row["source"]), 3),
-                        )
+                    brand_seen.add(row["url"])
+                    seed_rows.append(
+                        {
+                            "brand_id": brand_id,
+                            "title": row["title"],
+                            "url": row["url"],
+                            "snippet": row["snippet"],
+                            "source": row["source"] or "searxng",
+                            "reliability": round(_source_reliability(row["source"]), 3),
+                        }
                     )
 
+            if seed_rows:
+                # Brands first so the citations' foreign keys resolve, then one executemany for all seed evidence.
+                db.flush()
+                db.execute(insert(models.EvidenceCitation), seed_rows)
             db.commit()
 
     # Score snapshot for the current week.
@@ -944,87 +1252,25 @@ def refresh_universe_snapshot(
     )
     enrich_set = {row[0] for row in eligible[:enrich_top_n]} if eligible else set(brand_ids[:enrich_top_n])
 
-    snapshots_written = 0
-    for brand in brands[:target_brands]:
-        # Retrieval: brand context + site depth (both real web).
-        brand_host = _host(brand.website)
-        name_tokens = [t for t in re.split(r"[^a-z0-9]+", (brand.name or "").lower()) if len(t) >= 3]
-        name_tokens = [t for t in name_tokens if t not in {"the", "and", "for", "with", "official", "shop", "store"}]
-        required_tokens = min(2, len(name_tokens)) if name_tokens else 0
-
-        def _matches_brand(text: str) -> bool:
-            if required_tokens == 0:
-                return True
-            lowered = (text or "").lower()
-            hits = sum(1 for tok in name_tokens if tok in lowered)
-            return hits >= required_tokens
-
-        baseline_queries = [
-            f"site:{brand_host}",
-            f"\"{brand.name}\" \"{brand_host}\"",
-            f"\"{brand_host}\"",
-        ]
-        enrich_queries: list[str] = []
-        if brand.id in enrich_set:
-            enrich_queries = [
-                f"\"{brand.name}\" instagram",
-                f"\"{brand.name}\" tiktok",
-                f"\"{brand.name}\" reddit",
-                f"\"{brand.name}\" meta ad library",
-            ]
-
-        evidence_rows: list[dict[str, str]] = []
-        traffic_rows: list[dict[str, str]] = []
-        seen_urls: set[str] = set()
-
-        for q in baseline_queries:
-            provider, results = router.search(query=q, limit=20)
-            _ = provider
-            for r in results:
-                if not r.url or r.url in seen_urls:
-                    continue
-                url_host = _host(r.url)
-                # For baseline signals, only trust URLs that corroborate the brand's own host.
-                if url_host != brand_host and not url_host.endswith(f".{brand_host}"):
-                    continue
-                seen_urls.add(r.url)
-                row = {"title": r.title, "url": r.url, "snippet": r.snippet, "source": r.source}
-                if q.startswith("site:"):
-                    traffic_rows.append(row)
-                else:
-                    evidence_rows.append(row)
-
-        if enrich_queries:
-            for q in enrich_queries:
-                provider, results = router.search(query=q, limit=10)
-                _ = provider
-                for r in results:
-                    if not r.url or r.url in seen_urls:
-                        continue
-                    if not _matches_brand(f"{r.url} {r.title} {r.snippet}"):
-                        continue
-                    seen_urls.add(r.url)
-                    evidence_rows.append({"title": r.title, "url": r.url, "snippet": r.snippet, "source": r.source})
-
-        extra_evidence_rows: list[dict[str, str]] = []
-        if brand.id in enrich_set:
-            # Pull in additional evidence specifically relevant to production/cost-down angles.
-            _, prod = router.search(
-                query=f"\"{brand.name}\" manufacturing sourcing supplier co-packer 3pl fulfillment packaging",
-                limit=10,
-            )
-            _, site_prod = router.search(
-                query=f"site:{_host(brand.website)} \"made in\" manufacturing sourcing packaging fulfillment",
-                limit=10,
+    scored_brands = brands[:target_brands]
+    catalogs = _fetch_all(_try_shopify_products, [brand.website for brand in scored_brands])
+
+    # Retrieval runs first for every brand, then one vectorized metrics pass, then the per-brand writes.
+    # Searches are blocking I/O, so brands fan out on threads; the session stays on this thread. Each brand's
+    # queries run sequentially on its worker (no nested search_many pool), so search_concurrency bounds them all.
+    brand_hosts = [_host(brand.website) for brand in scored_brands]
+    with ThreadPoolExecutor(max_workers=router.settings.search_concurrency) as pool:
+        gathered = list(
+            pool.map(
+                _gather_brand_evidence,
+                repeat(router),
+                [brand.name for brand in scored_brands],
+                brand_hosts,
+                [brand.id in enrich_set for brand in scored_brands],
             )
-            extra_evidence_rows = [
-                {"title": r.title, "url": r.url, "snippet": r.snippet, "source": r.source}
-                for r in (list(prod) + list(site_prod))
-                if r.url
-            ]
-
-        sku_count, median_price = _try_shopify_products(brand.website)
-        metrics = _compute_snapshot_metrics(
+        )
+    metric_inputs = [
+        _snapshot_inputs(
             category=brand.category,
             evidence_results=evidence_rows,
             traffic_results=traffic_rows,
@@ -1032,15 +1278,66 @@ def refresh_universe_snapshot(
             sku_count=sku_count,
             median_price_usd=median_price,
         )
+        for brand, brand_host, (sku_count, median_price), (evidence_rows, traffic_rows, _) in zip(
+            scored_brands, brand_hosts, catalogs, gathered
+        )
+    ]
+    brand_metrics = _compute_snapshot_metrics(metric_inputs)
 
-        # Delta vs previous week.
-        prev = (
-            db.query(models.Scorecard)
-            .filter(models.Scorecard.brand_id == brand.id, models.Scorecard.snapshot_week < snapshot_week)
-            .order_by(models.Scorecard.snapshot_week.desc())
-            .first()
+    scored_ids = [brand.id for brand in scored_brands]
+
+    # Heat from each brand's most recent earlier snapshot, loaded in one query for the whole batch.
+    prev_weeks = (
+        select(models.Scorecard.brand_id, func.max(models.Scorecard.snapshot_week).label("snapshot_week"))
+        .where(
+            models.Scorecard.brand_id.in_(scored_ids),
+            models.Scorecard.snapshot_week < snapshot_week,
+        )
+        .group_by(models.Scorecard.brand_id)
+        .subquery()
+    )
+    prev_heat_by_brand: dict[str, float] = dict(
+        db.query(models.Scorecard.brand_id, models.Scorecard.heat_score)
+        .join(
+            prev_weeks,
+            and_(
+                models.Scorecard.brand_id == prev_weeks.c.brand_id,
+                models.Scorecard.snapshot_week == prev_weeks.c.snapshot_week,
+            ),
+        )
+        .all()
+    )
+
+    # Existing rows for this week/day are loaded once and updated in place; new rows are inserted in bulk below.
+    observed = dt.date.today()
+    existing_scores = {
+        row.brand_id: row
+        for row in db.query(models.Scorecard).filter(
+            models.Scorecard.brand_id.in_(scored_ids), models.Scorecard.snapshot_week == snapshot_week
+        )
+    }
+    existing_points = {
+        (row.brand_id, row.metric): row
+        for row in db.query(models.TimeSeriesPoint).filter(
+            models.TimeSeriesPoint.brand_id.in_(scored_ids), models.TimeSeriesPoint.observed_at == observed
         )
-        delta_heat = float(metrics["heat_score"] - (prev.heat_score if prev else metrics["heat_score"]))
+    }
+    score_inserts: list[dict] = []
+    point_inserts: list[dict] = []
+    evidence_inserts: list[dict] = []
+    seen_urls_by_brand: defaultdict[str, set[str]] = defaultdict(set)
+    for brand_id, url in db.query(models.EvidenceCitation.brand_id, models.EvidenceCitation.url).filter(
+        models.EvidenceCitation.brand_id.in_(scored_ids)
+    ):
+        seen_urls_by_brand[brand_id].add(url)
+
+    snapshots_written = 0
+    for brand, (sku_count, _), (evidence_rows, traffic_rows, extra_evidence_rows), metrics in zip(
+        scored_brands, catalogs, gathered, brand_metrics
+    ):
+        # Delta vs previous week.
+        prev_heat = prev_heat_by_brand.get(brand.id)
+        delta_heat = float(metrics["heat_score"] - (prev_heat if prev_heat is not None else metrics["heat_score"]))
 
         # Confidence: count sources + whether we could observe products/pricing.
         unique_sources = {(_host(r["url"]) or r.get("source", "")).lower() for r in (evidence_rows + traffic_rows) if r.get("url")}
@@ -1067,120 +1364,80 @@ def refresh_universe_snapshot(
             metrics["capital_required_musd"],
         )
 
-        existing_score = (
-            db.query(models.Scorecard)
-            .filter(models.Scorecard.brand_id == brand.id, models.Scorecard.snapshot_week == snapshot_week)
-            .one_or_none()
-        )
+        score_values = {
+            "heat_score": round(metrics["heat_score"], 3),
+            "risk_score": round(metrics["risk_score"], 3),
+            "asymmetry_index": round(metrics["asymmetry_index"], 3),
+            "capital_intensity": round(metrics["capital_intensity"], 3),
+            "revenue_p10": round(metrics["revenue_p10"], 3),
+            "revenue_p50": round(metrics["revenue_p50"], 3),
+            "revenue_p90": round(metrics["revenue_p90"], 3),
+            "delta_heat": round(delta_heat, 3),
+            "confidence": round(confidence, 3),
+            "confidence_reasons": reasons,
+            "suggested_deal_structure": suggested,
+            "capital_required_musd": round(metrics["capital_required_musd"], 3),
+        }
+        existing_score = existing_scores.get(brand.id)
         if existing_score:
-            existing_score.heat_score = round(metrics["heat_score"], 3)
-            existing_score.risk_score = round(metrics["risk_score"], 3)
-            existing_score.asymmetry_index = round(metrics["asymmetry_index"], 3)
-            existing_score.capital_intensity = round(metrics["capital_intensity"], 3)
-            existing_score.revenue_p10 = round(metrics["revenue_p10"], 3)
-            existing_score.revenue_p50 = round(metrics["revenue_p50"], 3)
-            existing_score.revenue_p90 = round(metrics["revenue_p90"], 3)
-            existing_score.delta_heat = round(delta_heat, 3)
-            existing_score.confidence = round(confidence, 3)
-            existing_score.confidence_reasons = reasons
-            existing_score.suggested_deal_structure = suggested
-            existing_score.capital_required_musd = round(metrics["capital_required_musd"], 3)
+            for column, value in score_values.items():
+                setattr(existing_score, column, value)
         else:
-            db.add(
-                models.Scorecard(
-                    brand_id=brand.id,
-                    snapshot_week=snapshot_week,
-                    heat_score=round(metrics["heat_score"], 3),
-                    risk_score=round(metrics["risk_score"], 3),
-                    asymmetry_index=round(metrics["asymmetry_index"], 3),
-                    capital_intensity=round(metrics["capital_intensity"], 3),
-                    revenue_p10=round(metrics["revenue_p10"], 3),
-                    revenue_p50=round(metrics["revenue_p50"], 3),
-                    revenue_p90=round(metrics["revenue_p90"], 3),
-                    delta_heat=round(delta_heat, 3),
-                    confidence=round(confidence, 3),
-                    confidence_reasons=reasons,
-                    suggested_deal_structure=suggested,
-                    capital_required_musd=round(metrics["capital_required_musd"], 3),
-                )
-            )
+            score_inserts.append({"brand_id": brand.id, "snapshot_week": snapshot_week, **score_values})
 
         # Time series points: store computed proxy metrics daily (so sparklines show motion within a week).
         # Upsert by (brand, metric, observed_at).
-        observed = dt.date.today()
-        for metric_name in [
-            "heat",
-            "instagram_follower_velocity",
-            "tiktok_follower_velocity",
-            "engagement_rate",
-            "comments_to_likes_ratio",
-            "repeat_commenter_density",
-            "influencer_tag_overlap",
-            "ugc_repost_frequency",
-            "engagement_quality",
-            "website_traffic_k",
-            "sku_count",
-            "sellout_velocity",
-            "meta_ad_activity",
-            "hiring_velocity",
-            "stockist_expansion",
-            "google_trends_velocity",
-            "reddit_mentions",
-            "pinterest_saves_velocity",
-            "blog_mentions",
-            "resale_activity",
-        ]:
+        reliability = round(0.55 + confidence * 0.4, 3)
+        for metric_name in _TIMESERIES_METRICS:
             value = float(metrics.get(metric_name) or 0.0)
             if metric_name == "heat":
                 value = float(metrics["heat_score"])
 
-            existing_point = (
-                db.query(models.TimeSeriesPoint)
-                .filter(
-                    models.TimeSeriesPoint.brand_id == brand.id,
-                    models.TimeSeriesPoint.metric == metric_name,
-                    models.TimeSeriesPoint.observed_at == observed,
-                )
-                .one_or_none()
-            )
+            existing_point = existing_points.get((brand.id, metric_name))
             if existing_point:
                 existing_point.value = round(value, 3)
                 existing_point.source = "searxng"
-                existing_point.reliability = round(0.55 + confidence * 0.4, 3)
+                existing_point.reliability = reliability
             else:
-                db.add(
-                    models.TimeSeriesPoint(
-                        brand_id=brand.id,
-                        metric=metric_name,
-                        observed_at=observed,
-                        value=round(value, 3),
-                        source="searxng",
-                        reliability=round(0.55 + confidence * 0.4, 3),
-                    )
+                point_inserts.append(
+                    {
+                        "brand_id": brand.id,
+                        "metric": metric_name,
+                        "observed_at": observed,
+                        "value": round(value, 3),
+                        "source": "searxng",
+                        "reliability": reliability,
+                    }
                 )
 
         # Evidence: keep it real and deduped. Store a small baseline for all brands, and deeper evidence for the top set.
         evidence_cap = 12 if brand.id in enrich_set else 4
-        seen = {row[0] for row in db.query(models.EvidenceCitation.url).filter(models.EvidenceCitation.brand_id == brand.id).all()}
+        seen = seen_urls_by_brand[brand.id]
         # Prefer brand-site corroboration URLs first, then broader evidence, then extra enrichment.
         store_candidates = (traffic_rows + evidence_rows + extra_evidence_rows)[:evidence_cap]
         for r in store_candidates:
             if not r["url"] or r["url"] in seen:
                 continue
             seen.add(r["url"])
-            db.add(
-                models.EvidenceCitation(
-                    brand_id=brand.id,
-                    title=_clean_text(r["title"])[:240] or brand.name,
-                    url=_clean_text(r["url"])[:500],
-                    snippet=_clean_text(r["snippet"])[:600],
-                    source=_clean_text(r.get("source", "searxng"))[:120],
-                    reliability=round(_source_reliability(r.get("source", "searxng")), 3),
-                )
+            evidence_inserts.append(
+                {
+                    "brand_id": brand.id,
+                    "title": _clean_text(r["title"])[:240] or brand.name,
+                    "url": _clean_text(r["url"])[:500],
+                    "snippet": _clean_text(r["snippet"])[:600],
+                    "source": _clean_text(r.get("source", "searxng"))[:120],
+                    "reliability": round(_source_reliability(r.get("source", "searxng")), 3),
+                }
             )
 
         snapshots_written += 1
 
+    if score_inserts:
+        db.execute(insert(models.Scorecard), score_inserts)
+    if point_inserts:
+        db.execute(insert(models.TimeSeriesPoint), point_inserts)
+    if evidence_inserts:
+        db.execute(insert(models.EvidenceCitation), evidence_inserts)
     db.commit()
     return {
         "status": "ok",
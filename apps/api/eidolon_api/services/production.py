@@ -29,6 +29,11 @@ CATEGORY_HINTS = {
     "Wellness": "ingredient sourcing and contract manufacturing",
 }
 
+# The contract-rebid rationale only varies by category, so it is formatted once per category at import.
+_RFP_RATIONALE = "Run structured RFP across {} to compress COGS and lock better terms with dual-source coverage."
+_RFP_RATIONALE_BY_CATEGORY = {category: _RFP_RATIONALE.format(hint) for category, hint in CATEGORY_HINTS.items()}
+_DEFAULT_RFP_RATIONALE = _RFP_RATIONALE.format("supplier network")
+
 
 def _current_model(inputs: ProductionInputs) -> str:
     if inputs.capital_intensity < 38:
@@ -64,7 +69,7 @@ def _bottlenecks(inputs: ProductionInputs) -> list[str]:
 
 
 def build_production_snapshot(inputs: ProductionInputs) -> schemas.ProductionSnapshot:
-    return schemas.ProductionSnapshot(
+    return schemas.ProductionSnapshot.model_construct(
         current_model=_current_model(inputs),
         unit_economics_pressure=_pressure_label(inputs),
         bottlenecks=_bottlenecks(inputs),
@@ -79,21 +84,19 @@ def _base_savings(inputs: ProductionInputs) -> float:
 
 def build_production_options(inputs: ProductionInputs) -> list[schemas.ProductionOption]:
     base = _base_savings(inputs)
-    supplier_hint = CATEGORY_HINTS.get(inputs.category, "supplier network")
+    rfp_rationale = _RFP_RATIONALE_BY_CATEGORY.get(inputs.category, _DEFAULT_RFP_RATIONALE)
 
     options = [
-        schemas.ProductionOption(
+        schemas.ProductionOption.model_construct(
             option_name="Strategic Contract Rebid",
             mode="outsource",
             estimated_savings_pct=round(base * 0.7, 2),
             capex_impact_musd=0.4,
             time_to_impact_months=3,
             execution_risk="low",
-            rationale=(
-                f"Run structured RFP across {supplier_hint} to compress COGS and lock better terms with dual-source coverage."
-            ),
+            rationale=rfp_rationale,
         ),
-        schemas.ProductionOption(
+        schemas.ProductionOption.model_construct(
             option_name="Hybrid Regionalization",
             mode="hybrid",
             estimated_savings_pct=round(base * 0.95, 2),
@@ -102,7 +105,7 @@ def build_production_options(inputs: ProductionInputs) -> list[schemas.Productio
             execution_risk="medium",
             rationale="Split production by region to reduce freight, improve lead times, and protect against single-node disruption.",
         ),
-        schemas.ProductionOption(
+        schemas.ProductionOption.model_construct(
             option_name="SKU + Packaging Simplification",
             mode="licensing",
             estimated_savings_pct=round(base * 0.8, 2),
@@ -111,7 +114,7 @@ def build_production_options(inputs: ProductionInputs) -> list[schemas.Productio
             execution_risk="low",
             rationale="Rationalize long-tail SKUs and standardize components to lower MOQ waste and conversion complexity.",
         ),
-        schemas.ProductionOption(
+        schemas.ProductionOption.model_construct(
             option_name="Selective In-House Critical Process",
             mode="inhouse",
             estimated_savings_pct=round(base * 1.1, 2),
@@ -129,7 +132,7 @@ def build_cost_reduction_opportunities(inputs: ProductionInputs) -> list[schemas
     confidence = max(0.35, min(0.93, inputs.confidence - 0.08))
 
     return [
-        schemas.CostOpportunity(
+        schemas.CostOpportunity.model_construct(
             title="Supplier portfolio rebalance",
             lever="procurement",
             estimated_savings_pct_low=round(base * 0.45, 2),
@@ -137,7 +140,7 @@ def build_cost_reduction_opportunities(inputs: ProductionInputs) -> list[schemas
             confidence=round(confidence, 3),
             rationale="Reprice top spend categories with volume commitments and indexed terms.",
         ),
-        schemas.CostOpportunity(
+        schemas.CostOpportunity.model_construct(
             title="Freight + fulfillment lane optimization",
             lever="logistics",
             estimated_savings_pct_low=round(base * 0.25, 2),
@@ -145,7 +148,7 @@ def build_cost_reduction_opportunities(inputs: ProductionInputs) -> list[schemas
             confidence=round(max(0.3, confidence - 0.05), 3),
             rationale="Use regional 3PL split and demand-cluster routing to reduce landed cost volatility.",
         ),
-        schemas.CostOpportunity(
+        schemas.CostOpportunity.model_construct(
             title="SKU and packaging architecture cleanup",
             lever="product mix",
             estimated_savings_pct_low=round(base * 0.3, 2),
@@ -25,3 +25,5 @@ class SearchProvider(Protocol):
     def enabled(self) -> bool: ...
 
     def search(self, query: str, limit: int = 5) -> list[SearchResult]: ...
+
+    def close(self) -> None: ...
@@ -16,6 +16,9 @@ class StubPaidProvider:
     def enabled(self) -> bool:
         return bool(self.api_key)
 
+    def close(self) -> None:
+        return None
+
     def search(self, query: str, limit: int = 5) -> list[SearchResult]:
         # Placeholder adapter. Integrate concrete API calls as keys/providers are activated.
         _ = (query, limit)
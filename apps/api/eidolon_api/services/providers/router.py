@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import datetime as dt
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
-from ...config import Settings
+from ...config import RuntimeSettings, split_csv
 from .base import SearchProvider, SearchResult
 from .paid import StubPaidProvider
 from .searxng import SearXNGProvider
@@ -29,17 +32,23 @@ class BudgetState:
 
 
 class SourceRouter:
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: RuntimeSettings) -> None:
         self.settings = settings
         self.state = BudgetState()
+        # Searches may run from worker threads; the lock covers budget reservations, not the provider I/O.
+        self._budget_lock = threading.Lock()
         self.providers: list[SearchProvider] = [
-            SearXNGProvider(base_url=settings.searxng_base_url, engines=settings.searxng_engines),
+            SearXNGProvider(base_url=settings.searxng_base_url, engines=",".join(split_csv(settings.searxng_engines))),
             StubPaidProvider("brave", settings.brave_api_key, 0.003, 0.84, 0.84),
             StubPaidProvider("serpapi", settings.serpapi_api_key, 0.01, 0.9, 0.88),
             StubPaidProvider("google_cse", settings.google_cse_api_key, 0.005, 0.85, 0.85),
             StubPaidProvider("dataforseo", settings.dataforseo_login, 0.015, 0.86, 0.9),
             StubPaidProvider("opencorporates", settings.opencorporates_api_key, 0.002, 0.8, 0.65),
         ]
+        # Provider keys/URLs are fixed at construction, so the ranking is computed once and reused per search.
+        self._ranked: list[SearchProvider] | None = None
+        self._search_pool: ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
 
     def _budget_available(self, provider: SearchProvider) -> bool:
         self.state.refresh()
@@ -59,22 +68,76 @@ class SourceRouter:
 
         return sorted(enabled, key=score)
 
-    def search(self, query: str, limit: int = 5) -> tuple[str, list[SearchResult]]:
-        for provider in self._rank_providers():
+    def _ranked_providers(self) -> list[SearchProvider]:
+        ranked = self._ranked
+        if ranked is None:
+            ranked = self._ranked = self._rank_providers()
+        return ranked
+
+    def invalidate_ranking(self) -> None:
+        """Call after changing `providers` (or their keys) so the next search re-ranks them."""
+        self._ranked = None
+
+    def _reserve_budget(self, provider: SearchProvider) -> tuple[dt.date, tuple[int, int]] | None:
+        # Check and charge in one critical section so concurrent searches cannot all pass the same check.
+        with self._budget_lock:
             if not self._budget_available(provider):
+                return None
+            self.state.daily_queries += 1
+            self.state.monthly_spend += provider.cost_per_query
+            return self.state.day, self.state.month
+
+    def _release_budget(self, provider: SearchProvider, reservation: tuple[dt.date, tuple[int, int]]) -> None:
+        day, month = reservation
+        with self._budget_lock:
+            # A rollover since the reservation already reset the counters it was charged to.
+            if self.state.day == day:
+                self.state.daily_queries -= 1
+            if self.state.month == month:
+                self.state.monthly_spend -= provider.cost_per_query
+
+    def search(self, query: str, limit: int = 5) -> tuple[str, list[SearchResult]]:
+        for provider in self._ranked_providers():
+            reservation = self._reserve_budget(provider)
+            if reservation is None:
                 continue
-            results = provider.search(query=query, limit=limit)
+            try:
+                results = provider.search(query=query, limit=limit)
+            except BaseException:
+                self._release_budget(provider, reservation)
+                raise
             if results:
-                self.state.daily_queries += 1
-                self.state.monthly_spend += provider.cost_per_query
                 return provider.name, results
+            # Only queries that produced results are charged.
+            self._release_budget(provider, reservation)
         return "none", []
 
+    def search_many(self, queries: Sequence[str], limit: int = 5) -> list[tuple[str, list[SearchResult]]]:
+        """Run independent queries concurrently (bounded by `search_concurrency`); results keep query order."""
+        if len(queries) <= 1:
+            return [self.search(query=query, limit=limit) for query in queries]
+        with self._pool_lock:
+            if self._search_pool is None:
+                self._search_pool = ThreadPoolExecutor(
+                    max_workers=self.settings.search_concurrency, thread_name_prefix="search"
+                )
+            pool = self._search_pool
+        return list(pool.map(lambda query: self.search(query=query, limit=limit), queries))
+
+    def close(self) -> None:
+        with self._pool_lock:
+            if self._search_pool is not None:
+                self._search_pool.shutdown(wait=False, cancel_futures=True)
+                self._search_pool = None
+        for provider in self.providers:
+            provider.close()
+
     def budget_snapshot(self) -> dict[str, float | int]:
-        self.state.refresh()
-        return {
-            "daily_queries": self.state.daily_queries,
-            "daily_limit": self.settings.daily_query_budget,
-            "monthly_spend": round(self.state.monthly_spend, 4),
-            "monthly_limit": self.settings.monthly_spend_limit_usd,
-        }
+        with self._budget_lock:
+            self.state.refresh()
+            return {
+                "daily_queries": self.state.daily_queries,
+                "daily_limit": self.settings.daily_query_budget,
+                "monthly_spend": round(self.state.monthly_spend, 4),
+                "monthly_limit": self.settings.monthly_spend_limit_usd,
+            }
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import httpx
 
@@ -15,15 +15,26 @@ class SearXNGProvider:
     cost_per_query: float = 0.0
     reliability: float = 0.62
     freshness: float = 0.7
+    # One pooled client per provider keeps connections alive across the hundreds of queries in a refresh.
+    _client: httpx.Client | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.enabled():
+            self._client = httpx.Client(base_url=self.base_url.rstrip("/"), timeout=10.0)
 
     def enabled(self) -> bool:
         return bool(self.base_url)
 
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
     def search(self, query: str, limit: int = 5) -> list[SearchResult]:
-        if not self.enabled():
+        client = self._client
+        if client is None:
             return []
 
-        url = f"{self.base_url.rstrip('/')}/search"
         base_params = {
             "q": query,
             "format": "json",
@@ -32,8 +43,7 @@ class SearXNGProvider:
         }
 
         def _fetch(params: dict) -> dict:
-            with httpx.Client(timeout=10.0) as client:
-                res = client.get(url, params=params)
+            res = client.get("/search", params=params)
             res.raise_for_status()
             return res.json()
 
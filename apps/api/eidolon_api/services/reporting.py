@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime as dt
+from collections.abc import Iterator
 from pathlib import Path
 
 from reportlab.lib.pagesizes import letter
@@ -9,7 +10,7 @@ from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
-from .scoring import build_brand_profile, build_feed
+from .scoring import build_brand_profile, build_brand_profiles, build_feed
 
 
 class ReportService:
@@ -34,7 +35,9 @@ class ReportService:
         db.commit()
 
     def generate(self, db: Session, req: schemas.ReportRequest) -> schemas.ReportArtifact:
-        profile = build_brand_profile(db, req.brand_id)
+        return self._render(db=db, profile=build_brand_profile(db, req.brand_id))
+
+    def _render(self, db: Session, profile: schemas.BrandProfile) -> schemas.ReportArtifact:
         timestamp = dt.datetime.now(dt.UTC)
 
         filename = f"{profile.brand.id}_{timestamp.strftime('%Y%m%dT%H%M%SZ')}.pdf"
@@ -243,12 +246,11 @@ class ReportService:
             summary=summary,
         )
 
-    def generate_top_ranked(self, db: Session, limit: int = 20) -> list[schemas.ReportArtifact]:
+    def iter_top_ranked(self, db: Session, limit: int = 20) -> Iterator[schemas.ReportArtifact]:
         feed = build_feed(db=db, sort="heat", limit=limit)
-        artifacts: list[schemas.ReportArtifact] = []
+        profiles = build_brand_profiles(db=db, brand_ids=[item.brand_id for item in feed.items])
+        for profile in profiles:
+            yield self._render(db=db, profile=profile)
 
-        for item in feed.items:
-            artifact = self.generate(db=db, req=schemas.ReportRequest(brand_id=item.brand_id))
-            artifacts.append(artifact)
-
-        return artifacts
+    def generate_top_ranked(self, db: Session, limit: int = 20) -> list[schemas.ReportArtifact]:
+        return list(self.iter_top_ranked(db=db, limit=limit))
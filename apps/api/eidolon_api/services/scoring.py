@@ -5,7 +5,7 @@ import re
 from statistics import fmean
 from urllib.parse import urlparse
 
-from sqlalchemy import desc, func, or_
+from sqlalchemy import desc, func, or_, select
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
@@ -17,6 +17,9 @@ from .production import (
 )
 from .entity import canonical_display_name, entity_key_from_name
 
+# Response models here are assembled from our own DB rows, so they use model_construct() and skip field
+# re-validation; request payloads are still fully validated at the API boundary.
+
 _NON_BRAND_HOST_FRAGMENTS = (
     "cambridge.org",
     "merriam-webster.com",
@@ -42,6 +45,24 @@ def _host(url: str) -> str:
         host = host[4:]
     return host
 
+# Plain column tuples for the feed: read-only rows skip ORM identity-map and instance state bookkeeping.
+_FEED_COLUMNS = (
+    models.Brand.id,
+    models.Brand.name,
+    models.Brand.entity_key,
+    models.Brand.category,
+    models.Brand.region,
+    models.Brand.website,
+    models.Scorecard.heat_score,
+    models.Scorecard.risk_score,
+    models.Scorecard.asymmetry_index,
+    models.Scorecard.capital_intensity,
+    models.Scorecard.revenue_p50,
+    models.Scorecard.capital_required_musd,
+    models.Scorecard.delta_heat,
+    models.Scorecard.confidence,
+)
+
 SORT_MAP = {
     "heat": desc(models.Scorecard.heat_score),
     "asymmetry": desc(models.Scorecard.asymmetry_index),
@@ -153,7 +174,7 @@ def _build_engagement_breakdown(
     influencer_overlap_score = _clamp(35 + score.heat_score * 0.35 + score.asymmetry_index * 0.25, 5.0, 99.0)
     geographic_spread_score = _clamp(24 + score.heat_score * 0.42 - score.risk_score * 0.12, 5.0, 99.0)
 
-    return schemas.EngagementBreakdown(
+    return schemas.EngagementBreakdown.model_construct(
         comments_to_likes_ratio=round(comments_to_likes, 3),
         repeat_commenter_density=round(repeat_commenter_density, 3),
         ugc_depth_score=round(ugc_depth_score, 2),
@@ -165,7 +186,7 @@ def _build_engagement_breakdown(
 
 def _build_signal_snapshot(points: list[models.TimeSeriesPoint]) -> schemas.DataCollectionLayerSnapshot:
     social = [
-        schemas.SignalPoint(
+        schemas.SignalPoint.model_construct(
             metric=label,
             current=round(_metric_current_and_delta(points, metric=metric, default=0.0)[0], 3),
             delta_12w=round(_metric_current_and_delta(points, metric=metric, default=0.0)[1], 3),
@@ -174,7 +195,7 @@ def _build_signal_snapshot(points: list[models.TimeSeriesPoint]) -> schemas.Data
         for metric, label, source in SOCIAL_SIGNAL_CONFIG
     ]
     commerce = [
-        schemas.SignalPoint(
+        schemas.SignalPoint.model_construct(
             metric=label,
             current=round(_metric_current_and_delta(points, metric=metric, default=0.0)[0], 3),
             delta_12w=round(_metric_current_and_delta(points, metric=metric, default=0.0)[1], 3),
@@ -183,7 +204,7 @@ def _build_signal_snapshot(points: list[models.TimeSeriesPoint]) -> schemas.Data
         for metric, label, source in COMMERCE_SIGNAL_CONFIG
     ]
     search_cultural = [
-        schemas.SignalPoint(
+        schemas.SignalPoint.model_construct(
             metric=label,
             current=round(_metric_current_and_delta(points, metric=metric, default=0.0)[0], 3),
             delta_12w=round(_metric_current_and_delta(points, metric=metric, default=0.0)[1], 3),
@@ -191,7 +212,7 @@ def _build_signal_snapshot(points: list[models.TimeSeriesPoint]) -> schemas.Data
         )
         for metric, label, source in SEARCH_CULTURAL_SIGNAL_CONFIG
     ]
-    return schemas.DataCollectionLayerSnapshot(
+    return schemas.DataCollectionLayerSnapshot.model_construct(
         social_signals=social,
         commerce_signals=commerce,
         search_cultural_signals=search_cultural,
@@ -227,7 +248,7 @@ def _build_financial_inference(score: models.Scorecard, category: str) -> schema
         "Hiring/ad-activity momentum is treated as directional, not definitive.",
     ]
 
-    return schemas.FinancialInferenceModel(
+    return schemas.FinancialInferenceModel.model_construct(
         traffic_estimate_kmo=round(traffic_estimate_kmo, 2),
         conversion_assumption_pct=round(conversion_pct, 2),
         average_order_value_usd=round(aov, 2),
@@ -283,7 +304,7 @@ def _build_risk_scan(
         f"Primary operational bottleneck: {production_snapshot.bottlenecks[0]}",
     ]
 
-    return schemas.RiskScanSummary(
+    return schemas.RiskScanSummary.model_construct(
         trademark_strength=trademark_strength,  # type: ignore[arg-type]
         corporate_registry_verified=registry_verified,
         litigation_flags=litigation_flags,
@@ -342,12 +363,12 @@ def build_feed(
     _ = time_window
     latest_week = get_latest_snapshot_week(db)
     if latest_week is None:
-        return schemas.FeedResponse(generated_at=dt.datetime.now(dt.UTC), sort=sort, items=[])
+        return schemas.FeedResponse.model_construct(generated_at=dt.datetime.now(dt.UTC), sort=sort, items=[])
 
     query = (
-        db.query(models.Brand, models.Scorecard)
+        select(*_FEED_COLUMNS)
         .join(models.Scorecard, models.Brand.id == models.Scorecard.brand_id)
-        .filter(models.Scorecard.snapshot_week == latest_week)
+        .where(models.Scorecard.snapshot_week == latest_week)
     )
 
     if search:
@@ -362,47 +383,47 @@ def build_feed(
                     | models.Brand.region.ilike(term)
                     | models.Brand.website.ilike(term)
                 )
-            query = query.filter(or_(*clauses))
+            query = query.where(or_(*clauses))
 
     order_by = SORT_MAP.get(sort, SORT_MAP["heat"])
-    rows = query.order_by(order_by, desc(models.Scorecard.confidence)).all()
+    rows = db.execute(query.order_by(order_by, desc(models.Scorecard.confidence)))
 
     items: list[schemas.BrandSummary] = []
     seen_entities: set[str] = set()
-    for brand, score in rows:
-        website_host = _host(brand.website)
+    for row in rows:
+        website_host = _host(row.website)
         if not website_host or any(fragment in website_host for fragment in _NON_BRAND_HOST_FRAGMENTS):
             continue
 
-        display_name = _canonical_company_name(brand.name)
-        entity_key = getattr(brand, "entity_key", None) or entity_key_from_name(display_name) or display_name.lower()
+        display_name = _canonical_company_name(row.name)
+        entity_key = row.entity_key or entity_key_from_name(display_name) or display_name.lower()
         if entity_key in seen_entities:
             continue
         seen_entities.add(entity_key)
 
         rank = len(items) + 1
         items.append(
-            schemas.BrandSummary(
+            schemas.BrandSummary.model_construct(
                 rank=rank,
-                brand_id=brand.id,
+                brand_id=row.id,
                 name=display_name,
-                category=brand.category,
-                region=brand.region,
-                heat_score=round(score.heat_score, 2),
-                risk_score=round(score.risk_score, 2),
-                asymmetry_index=round(score.asymmetry_index, 2),
-                capital_intensity=round(score.capital_intensity, 2),
-                revenue_p50=round(score.revenue_p50, 2),
-                capital_required_musd=round(score.capital_required_musd, 2),
-                delta_heat=round(score.delta_heat, 2),
-                confidence=round(score.confidence, 3),
-                deeper_analysis_required=_deeper_analysis_required(score.heat_score),
+                category=row.category,
+                region=row.region,
+                heat_score=round(row.heat_score, 2),
+                risk_score=round(row.risk_score, 2),
+                asymmetry_index=round(row.asymmetry_index, 2),
+                capital_intensity=round(row.capital_intensity, 2),
+                revenue_p50=round(row.revenue_p50, 2),
+                capital_required_musd=round(row.capital_required_musd, 2),
+                delta_heat=round(row.delta_heat, 2),
+                confidence=round(row.confidence, 3),
+                deeper_analysis_required=_deeper_analysis_required(row.heat_score),
             )
         )
         if len(items) >= limit:
             break
 
-    return schemas.FeedResponse(generated_at=dt.datetime.now(dt.UTC), sort=sort, items=items)
+    return schemas.FeedResponse.model_construct(generated_at=dt.datetime.now(dt.UTC), sort=sort, items=items)
 
 
 def build_brand_profile(db: Session, brand_id: str) -> schemas.BrandProfile:
@@ -432,10 +453,70 @@ def build_brand_profile(db: Session, brand_id: str) -> schemas.BrandProfile:
         .order_by(models.TimeSeriesPoint.observed_at.asc())
         .all()
     )
+    return _assemble_brand_profile(brand=brand, score=score, evidence=evidence, points=points)
+
+
+def build_brand_profiles(db: Session, brand_ids: list[str]) -> list[schemas.BrandProfile]:
+    """Batch variant of build_brand_profile: four queries for any number of brands, results in input order."""
+    if not brand_ids:
+        return []
+
+    brands = {b.id: b for b in db.query(models.Brand).filter(models.Brand.id.in_(brand_ids))}
 
+    latest_scores: dict[str, models.Scorecard] = {}
+    for score in (
+        db.query(models.Scorecard)
+        .filter(models.Scorecard.brand_id.in_(brand_ids))
+        .order_by(desc(models.Scorecard.snapshot_week))
+    ):
+        latest_scores.setdefault(score.brand_id, score)
+
+    evidence_by_brand: dict[str, list[models.EvidenceCitation]] = {brand_id: [] for brand_id in brand_ids}
+    for item in (
+        db.query(models.EvidenceCitation)
+        .filter(models.EvidenceCitation.brand_id.in_(brand_ids))
+        .order_by(desc(models.EvidenceCitation.reliability))
+    ):
+        bucket = evidence_by_brand[item.brand_id]
+        if len(bucket) < 8:
+            bucket.append(item)
+
+    points_by_brand: dict[str, list[models.TimeSeriesPoint]] = {brand_id: [] for brand_id in brand_ids}
+    for point in (
+        db.query(models.TimeSeriesPoint)
+        .filter(models.TimeSeriesPoint.brand_id.in_(brand_ids))
+        .order_by(models.TimeSeriesPoint.observed_at.asc())
+    ):
+        points_by_brand[point.brand_id].append(point)
+
+    profiles: list[schemas.BrandProfile] = []
+    for brand_id in brand_ids:
+        brand = brands.get(brand_id)
+        if not brand:
+            raise ValueError(f"Unknown brand_id={brand_id}")
+        score = latest_scores.get(brand_id)
+        if not score:
+            raise ValueError(f"No scorecard for brand_id={brand_id}")
+        profiles.append(
+            _assemble_brand_profile(
+                brand=brand,
+                score=score,
+                evidence=evidence_by_brand[brand_id],
+                points=points_by_brand[brand_id],
+            )
+        )
+    return profiles
+
+
+def _assemble_brand_profile(
+    brand: models.Brand,
+    score: models.Scorecard,
+    evidence: list[models.EvidenceCitation],
+    points: list[models.TimeSeriesPoint],
+) -> schemas.BrandProfile:
     display_name = _canonical_company_name(brand.name)
 
-    confidence = schemas.ConfidenceEnvelope(
+    confidence = schemas.ConfidenceEnvelope.model_construct(
         overall=round(score.confidence, 3),
         reasons=list(score.confidence_reasons or []),
     )
@@ -469,7 +550,7 @@ def build_brand_profile(db: Session, brand_id: str) -> schemas.BrandProfile:
         ownership_target=ownership_target,
         capital_required_musd=score.capital_required_musd,
     )
-    deal_structuring = schemas.DealStructuringPlan(
+    deal_structuring = schemas.DealStructuringPlan.model_construct(
         suggested_entry_strategy=score.suggested_deal_structure,
         suggested_ownership_target_pct=ownership_target,
         estimated_capital_required_musd=round(score.capital_required_musd, 2),
@@ -488,8 +569,8 @@ def build_brand_profile(db: Session, brand_id: str) -> schemas.BrandProfile:
         "cost-down potential from the lead procurement lever."
     )
 
-    return schemas.BrandProfile(
-        brand=schemas.BrandData(
+    return schemas.BrandProfile.model_construct(
+        brand=schemas.BrandData.model_construct(
             id=brand.id,
             name=display_name,
             category=brand.category,
@@ -497,7 +578,7 @@ def build_brand_profile(db: Session, brand_id: str) -> schemas.BrandProfile:
             website=brand.website,
             description=brand.description,
         ),
-        scorecard=schemas.ScoreCard(
+        scorecard=schemas.ScoreCard.model_construct(
             snapshot_week=score.snapshot_week,
             heat_score=round(score.heat_score, 2),
             risk_score=round(score.risk_score, 2),
@@ -513,7 +594,7 @@ def build_brand_profile(db: Session, brand_id: str) -> schemas.BrandProfile:
         ),
         confidence=confidence,
         evidence=[
-            schemas.EvidenceCitation(
+            schemas.EvidenceCitation.model_construct(
                 title=e.title,
                 url=e.url,
                 source=e.source,
@@ -541,10 +622,10 @@ def get_timeseries(db: Session, brand_id: str) -> schemas.TimeSeriesResponse:
         .order_by(models.TimeSeriesPoint.observed_at.asc())
         .all()
     )
-    return schemas.TimeSeriesResponse(
+    return schemas.TimeSeriesResponse.model_construct(
         brand_id=brand_id,
         points=[
-            schemas.TimeSeriesPoint(
+            schemas.TimeSeriesPoint.model_construct(
                 metric=p.metric,
                 observed_at=p.observed_at,
                 value=round(p.value, 3),
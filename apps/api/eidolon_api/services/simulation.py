@@ -17,12 +17,13 @@ SCENARIO_PARAMS = {
 }
 
 
+_BAND_PERCENTILES = (10, 50, 90)
+
+
 def _band(values: np.ndarray) -> PercentileBand:
-    return PercentileBand(
-        p10=float(np.percentile(values, 10)),
-        p50=float(np.percentile(values, 50)),
-        p90=float(np.percentile(values, 90)),
-    )
+    # One partition pass for all three quantiles instead of one per np.percentile call.
+    p10, p50, p90 = np.percentile(values, _BAND_PERCENTILES)
+    return PercentileBand(p10=float(p10), p50=float(p50), p90=float(p90))
 
 
 def run_simulation(req: SimulateRequest) -> ScenarioResult:
@@ -33,17 +34,19 @@ def run_simulation(req: SimulateRequest) -> ScenarioResult:
     revenue_deltas = rng.normal(loc=params["rev_mu"], scale=params["rev_sigma"], size=req.iterations)
     margin_deltas = rng.normal(loc=params["margin_mu"], scale=params["margin_sigma"], size=req.iterations)
 
-    # constrain extreme outliers for stability
-    revenue_deltas = np.clip(revenue_deltas, -0.5, 0.3)
-    margin_deltas = np.clip(margin_deltas, -0.35, 0.2)
+    # constrain extreme outliers for stability, then scale to percent; in place to avoid per-step copies
+    np.clip(revenue_deltas, -0.5, 0.3, out=revenue_deltas)
+    np.clip(margin_deltas, -0.35, 0.2, out=margin_deltas)
+    revenue_deltas *= 100
+    margin_deltas *= 100
 
     result = ScenarioResult(
         brand_id=req.brand_id,
         preset=req.preset,
         seed=req.seed,
         outcomes={
-            "revenue_delta_pct": _band(revenue_deltas * 100),
-            "margin_delta_pct": _band(margin_deltas * 100),
+            "revenue_delta_pct": _band(revenue_deltas),
+            "margin_delta_pct": _band(margin_deltas),
             "risk_shift": round(float(params["risk"]), 3),
         },
     )
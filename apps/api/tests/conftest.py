@@ -0,0 +1,13 @@
+import os
+import shutil
+import tempfile
+
+# Settings are read when eidolon_api is first imported, so the suite's database and report output are redirected
+# before any test module imports it; running the tests never touches ./eidolon.db or ./reports/generated.
+_TMP_DIR = tempfile.mkdtemp(prefix="eidolon-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+pysqlite:///{os.path.join(_TMP_DIR, 'eidolon.db')}"
+os.environ["REPORTS_DIR"] = os.path.join(_TMP_DIR, "reports")
+
+
+def pytest_unconfigure(config) -> None:
+    shutil.rmtree(_TMP_DIR, ignore_errors=True)
@@ -1,22 +1,34 @@
+import asyncio
+import dataclasses
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
 import datetime as dt
 
-from eidolon_api import models
-from eidolon_api.config import Settings
-from eidolon_api.database import SessionLocal
-from eidolon_api.main import app
+from eidolon_api import main, models
+from eidolon_api.cache import TTLCache
+from eidolon_api.config import Settings, get_settings
+from eidolon_api.database import SessionLocal, init_db
+from eidolon_api.main import app, feed_cache, get_report_service
+from eidolon_api.schemas import ReportBatchArtifact
 from eidolon_api.services.chat import ChatService
+from eidolon_api.services import ingestion
 from eidolon_api.services.ingestion import reset_all_data
+from eidolon_api.services.providers.base import SearchResult
+from eidolon_api.services.providers.router import SourceRouter
 
 
 @pytest.fixture()
 def client() -> TestClient:
     # Ensure tests do not rely on persisted local state.
+    init_db()
     db = SessionLocal()
+    feed_cache.clear()
     try:
         reset_all_data(db)
 
@@ -145,6 +157,49 @@ def test_feed_names_unique_in_ranked_view(client: TestClient) -> None:
     assert len(canonical) == len(set(canonical))
 
 
+def _cool_brand(brand_id: str) -> None:
+    db = SessionLocal()
+    try:
+        db.query(models.Scorecard).filter(models.Scorecard.brand_id == brand_id).update({"heat_score": 0.0})
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_feed_cache_invalidated_by_admin_refresh_and_reseed(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Ingestion itself is out of scope here; only the cache invalidation around it is exercised.
+    monkeypatch.setattr(main, "refresh_universe_snapshot", lambda **_: {})
+    monkeypatch.setattr(main, "reseed_universe", lambda **_: {})
+    params = {"sort": "heat", "limit": 5}
+
+    def top_id() -> str:
+        res = client.get("/v1/feed", params=params)
+        assert res.status_code == 200
+        return res.json()["items"][0]["brand_id"]
+
+    assert top_id() == "brand-test-001"
+    _cool_brand("brand-test-001")
+    assert top_id() == "brand-test-001"  # served from the cache
+    assert client.post("/v1/admin/refresh").status_code == 200
+    assert top_id() == "brand-test-002"
+
+    _cool_brand("brand-test-002")
+    assert top_id() == "brand-test-002"
+    assert client.post("/v1/admin/reseed").status_code == 200
+    assert top_id() == "brand-test-003"
+
+
+def test_feed_cache_keys_on_limit_and_search(client: TestClient) -> None:
+    full = client.get("/v1/feed", params={"sort": "heat", "limit": 5}).json()["items"]
+    short = client.get("/v1/feed", params={"sort": "heat", "limit": 2}).json()["items"]
+    searched = client.get("/v1/feed", params={"sort": "heat", "limit": 5, "search": "TestBrand-007"}).json()["items"]
+    assert len(full) == 5
+    assert [row["brand_id"] for row in short] == [row["brand_id"] for row in full[:2]]
+    assert [row["brand_id"] for row in searched] == ["brand-test-007"]
+
+
 def test_discover_endpoint(client: TestClient) -> None:
     res = client.get("/v1/discover", params={"industry": "outdoor apparel", "region": "north america", "limit": 8})
     assert res.status_code == 200
@@ -235,6 +290,29 @@ def test_chat_production_plan_mode(client: TestClient) -> None:
     assert isinstance(payload["citations"], list)
 
 
+def test_chat_batch_preserves_request_order(client: TestClient) -> None:
+    feed = client.get("/v1/feed", params={"limit": 2}).json()
+    brand_ids = [item["brand_id"] for item in feed["items"]]
+
+    body = {
+        "requests": [
+            {
+                "brand_id": brand_id,
+                "mode": "production_plan",
+                "messages": [{"role": "user", "content": "Give me a cheaper production strategy."}],
+            }
+            for brand_id in brand_ids
+        ]
+    }
+    res = client.post("/v1/chat/batch", json=body)
+    assert res.status_code == 200
+    payload = res.json()
+    assert payload["count"] == 2
+    for brand_id, response in zip(brand_ids, payload["responses"]):
+        assert response["answer"].startswith(brand_id.replace("brand-test", "TestBrand"))
+        assert "30/60/90" in response["answer"]
+
+
 def test_report_generation_mentions_cost_down(client: TestClient) -> None:
     feed = client.get("/v1/feed", params={"limit": 1}).json()
     brand_id = feed["items"][0]["brand_id"]
@@ -255,6 +333,80 @@ def test_top_report_batch_endpoint(client: TestClient) -> None:
     assert len(payload["reports"]) == 2
 
 
+def test_top_report_batch_streams_valid_document(client: TestClient) -> None:
+    res = client.post("/v1/report/top", params={"limit": 3})
+    assert res.status_code == 200
+    batch = ReportBatchArtifact.model_validate_json(res.content)
+    assert batch.count == 3
+    assert len(batch.reports) == 3
+    assert len({report.brand_id for report in batch.reports}) == 3
+
+    db = SessionLocal()
+    try:
+        reset_all_data(db)
+    finally:
+        db.close()
+    res = client.post("/v1/report/top", params={"limit": 3})
+    assert res.status_code == 200
+    batch = ReportBatchArtifact.model_validate_json(res.content)
+    assert batch.count == 0
+    assert batch.reports == []
+
+
+def test_top_report_batch_setup_failure_returns_error(client: TestClient) -> None:
+    class FailingReportService:
+        def iter_top_ranked(self, db, limit=20):
+            raise RuntimeError("profile load failed")
+            yield  # pragma: no cover
+
+    app.dependency_overrides[get_report_service] = FailingReportService
+    try:
+        with TestClient(app, raise_server_exceptions=False) as failing_client:
+            res = failing_client.post("/v1/report/top", params={"limit": 2})
+    finally:
+        app.dependency_overrides.pop(get_report_service, None)
+    assert res.status_code == 500
+
+
+class _SlowProvider:
+    name = "slow"
+    cost_per_query = 0.01
+    reliability = 0.9
+    freshness = 0.9
+
+    def __init__(self, hit: bool = True) -> None:
+        self.hit = hit
+
+    def enabled(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        return None
+
+    def search(self, query: str, limit: int = 5) -> list[SearchResult]:
+        time.sleep(0.02)
+        return [SearchResult(title=query, url=f"https://example.com/{query}", snippet="", source="slow")] if self.hit else []
+
+
+def test_router_budget_holds_under_concurrent_searches() -> None:
+    router = SourceRouter(dataclasses.replace(get_settings(), daily_query_budget=5))
+    router.providers = [_SlowProvider()]
+    router.invalidate_ranking()
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        outcomes = list(pool.map(lambda i: router.search(query=f"q{i}"), range(20)))
+    assert sum(1 for provider, _ in outcomes if provider == "slow") == 5
+    assert router.budget_snapshot()["daily_queries"] == 5
+    router.close()
+
+    # Searches that come back empty hand their reservation back.
+    empty_router = SourceRouter(dataclasses.replace(get_settings(), daily_query_budget=5))
+    empty_router.providers = [_SlowProvider(hit=False)]
+    empty_router.invalidate_ranking()
+    assert empty_router.search(query="nothing") == ("none", [])
+    assert empty_router.budget_snapshot()["daily_queries"] == 0
+    empty_router.close()
+
+
 def test_chat_guardrail_detection() -> None:
     svc = ChatService(Settings())
     assert svc._should_force_profile_grounding(
@@ -263,3 +415,63 @@ def test_chat_guardrail_detection() -> None:
     assert not svc._should_force_profile_grounding(
         "Brand is strong on heat and has two actionable production options."
     )
+
+
+def _completion_attempts(statuses: list[int], monkeypatch: pytest.MonkeyPatch) -> tuple[int, list[int]]:
+    """Drive `_post_completion` against a transport that answers with `statuses` in turn."""
+    monkeypatch.setattr("eidolon_api.services.chat.random.uniform", lambda low, high: 0.0)
+    seen: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses[len(seen)]
+        seen.append(status)
+        return httpx.Response(status, json={})
+
+    async def run() -> int:
+        svc = ChatService(Settings())
+        svc._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            response = await svc._post_completion("https://llm.test/chat/completions", headers={}, body=b"{}")
+        finally:
+            await svc.aclose()
+        return response.status_code
+
+    return asyncio.run(run()), seen
+
+
+def test_chat_completion_retries_then_succeeds(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert _completion_attempts([429, 503, 200], monkeypatch) == (200, [429, 503, 200])
+
+
+def test_chat_completion_gives_up_after_last_attempt(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert _completion_attempts([502, 429, 500], monkeypatch) == (500, [502, 429, 500])
+
+
+def test_chat_completion_does_not_retry_client_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert _completion_attempts([400], monkeypatch) == (400, [400])
+
+
+def test_shopify_catalog_conditional_get(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ingestion, "_CATALOG_CACHE", TTLCache(maxsize=8, ttl=3600))
+    catalog = {"products": [{"variants": [{"price": "10.00"}]}, {"variants": [{"price": "30.00"}]}]}
+    replies = [
+        httpx.Response(200, json=catalog, headers={"etag": '"v1"'}),
+        httpx.Response(304),
+        httpx.Response(200, json=catalog),
+        httpx.Response(304),
+    ]
+    sent: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.headers.get("if-none-match"))
+        return replies[len(sent) - 1]
+
+    async def run() -> list[tuple[int | None, float | None]]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            return [await ingestion._try_shopify_products(http, "https://shop.test") for _ in replies]
+
+    summary = ingestion._catalog_summary(catalog)
+    # A 304 reuses the cached summary; once a 200 arrives without validators the entry is dropped, so the next
+    # request is unconditional and a stray 304 is not mistaken for a cache hit.
+    assert asyncio.run(run()) == [summary, summary, summary, (None, None)]
+    assert sent == [None, '"v1"', '"v1"', None]